@@ -6,17 +6,42 @@ from job descriptions using Ollama LLM with fallback to rule-based extraction.
 """
 import os
 import time
+import atexit
 import logging
-import json
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+from services.cache_manager import CacheManager, text_digest
+from utils.json_utils import extract_json_block, JsonObjectTracker
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that encodes and decodes with orjson"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response without a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
 
 # Create Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)  # Use orjson for request and response bodies
 CORS(app)  # Enable CORS
 
 # Configure logging
@@ -30,30 +55,139 @@ logger = logging.getLogger(__name__)
 OLLAMA_URL = os.environ.get('OLLAMA_URL', 'http://localhost:11434')
 OLLAMA_MODEL = os.environ.get('OLLAMA_MODEL', 'llama3.2')
 OLLAMA_TIMEOUT = int(os.environ.get('OLLAMA_TIMEOUT', 240))
+OLLAMA_NUM_PARALLEL = int(os.environ.get('OLLAMA_NUM_PARALLEL', 4))
+OLLAMA_MAX_DESC_LENGTH = 2000
+OLLAMA_KEEP_ALIVE = os.environ.get('OLLAMA_KEEP_ALIVE', '30m')
+MAX_TOKEN_GENERATION = int(os.environ.get('MAX_TOKEN_GENERATION', 1024))
+OLLAMA_HEALTH_INTERVAL = int(os.environ.get('OLLAMA_HEALTH_INTERVAL', 10))
+
+# Each worker process limits its own Ollama calls, so the default splits
+# OLLAMA_NUM_PARALLEL across the workers (gunicorn.conf.py exports GUNICORN_WORKERS;
+# the development server is a single process)
+WORKER_PROCESSES = int(os.environ.get('GUNICORN_WORKERS', 1))
+MAX_CONCURRENT_OLLAMA = int(os.environ.get(
+    'MAX_CONCURRENT_OLLAMA', max(1, OLLAMA_NUM_PARALLEL // WORKER_PROCESSES)
+))
+OLLAMA_QUEUE_TIMEOUT = float(os.environ.get('OLLAMA_QUEUE_TIMEOUT', 0.5))
+
+# Circuit breaker: after OLLAMA_FAILURE_THRESHOLD failed calls within
+# OLLAMA_FAILURE_WINDOW seconds, skip Ollama for OLLAMA_CIRCUIT_COOLDOWN seconds
+OLLAMA_FAILURE_THRESHOLD = int(os.environ.get('OLLAMA_FAILURE_THRESHOLD', 5))
+OLLAMA_FAILURE_WINDOW = int(os.environ.get('OLLAMA_FAILURE_WINDOW', 30))
+OLLAMA_CIRCUIT_COOLDOWN = int(os.environ.get('OLLAMA_CIRCUIT_COOLDOWN', 30))
+
+# Cache configuration
+CACHE_TTL = int(os.environ.get('CACHE_TTL', 3600))
+CACHE_MAX_SIZE = int(os.environ.get('CACHE_MAX_SIZE', 1000))
+
+# Maximum number of job descriptions accepted by the batch endpoint
+MAX_BATCH_SIZE = int(os.environ.get('MAX_BATCH_SIZE', 20))
+
+# Request bodies larger than this are rejected before they are parsed. Werkzeug
+# stops reading a chunked body at MAX_CONTENT_LENGTH without an error, so it reads
+# one byte past the limit and a body that long is known to be too large
+MAX_REQUEST_BODY_BYTES = int(os.environ.get('MAX_REQUEST_BODY_BYTES', 256 * 1024))
+app.config['MAX_CONTENT_LENGTH'] = MAX_REQUEST_BODY_BYTES + 1
+
+# Shared HTTP session so Ollama calls reuse pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32, max_retries=0)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+SESSION.headers.update({'Connection': 'keep-alive', 'Accept-Encoding': 'gzip, deflate'})
+atexit.register(SESSION.close)
+
+# Worker pool used to overlap several Ollama calls issued by a single request; no
+# wider than the process's Ollama slots, so batch items queue here instead of being shed
+_OLLAMA_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_OLLAMA, thread_name_prefix='ollama')
+
+# Ollama extraction results keyed by a digest of the (truncated) description
+ollama_cache = CacheManager(max_size=CACHE_MAX_SIZE, ttl=CACHE_TTL)
+
+# Latest result of the background Ollama health check
+_ollama_up = False
+
+# Limit on in-flight Ollama generations per worker process
+_ollama_slots = threading.BoundedSemaphore(MAX_CONCURRENT_OLLAMA)
+
+# Circuit breaker state: recent failure times and when Ollama may be tried again
+_ollama_failures = deque()
+_ollama_circuit_open_until = 0.0
+_ollama_circuit_lock = threading.Lock()
+
+# Patterns used by the rule-based fallback extractor, compiled once at import
+_COMPANY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:company|organization|employer)[\s:]+([A-Za-z0-9\s\-\&\.]+)',
+    r'(?:at|with|for|by)\s+([A-Za-z0-9\s\-\&\.]+?)(?:\s+is|\s+are|\s+has|\s+have)',
+    r'about\s+([A-Za-z0-9\s\-\&\.]+?)(?:\n|\.|,|:)',
+))
+
+_POSITION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:job title|position|role|job)[\s:]+([A-Za-z0-9\s\-\&\/\(\)\,\.]+)',
+    r'hiring(?:[\s:]+)(?:a|an)?(?:[\s:]+)([A-Za-z0-9\s\-\&\/\(\)]+)',
+))
+
+_LOCATION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:location|based\s+in|located\s+in)[\s:]+([A-Za-z0-9\s\-\,\.]+)',
+    r'(?:in|at)\s+([A-Za-z]+(?:\s*,\s*[A-Za-z]+)?)',
+))
+
+_SALARY_RANGE_PATTERN = re.compile(
+    r'(\d+(?:,\d+)?)\s*(?:k|K|thousand)?\s*(?:-|to|–)\s*(\d+(?:,\d+)?)\s*(?:k|K|thousand)?'
+)
+
 def check_ollama_availability():
     """Check if Ollama is available and running"""
     try:
-        response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
+        # HEAD on the root is Ollama's cheapest liveness endpoint
+        response = SESSION.head(f"{OLLAMA_URL}/", timeout=1)
         return response.status_code == 200
     except requests.RequestException:
         return False
 
-def extract_with_ollama(job_description):
-    """
-    Extract job data using Ollama model
-    
-    Args:
-        job_description (str): Job description text
-        
-    Returns:
-        dict: Extracted job data or None if processing failed
-    """
-    if not check_ollama_availability():
-        logger.warning("Ollama is not available. Using fallback methods.")
-        return None
+def warm_up_ollama():
+    """Load the model into Ollama's memory so the first extraction doesn't pay for it"""
+    try:
+        # A generate request without a prompt only loads the model
+        response = SESSION.post(
+            f"{OLLAMA_URL}/api/generate",
+            json={"model": OLLAMA_MODEL, "keep_alive": OLLAMA_KEEP_ALIVE},
+            timeout=OLLAMA_TIMEOUT
+        )
+        if response.status_code == 200:
+            logger.info(f"Ollama model {OLLAMA_MODEL} is loaded")
+        else:
+            logger.warning(f"Failed to warm up Ollama model: {response.text}")
+    except requests.RequestException as e:
+        logger.warning(f"Failed to warm up Ollama model: {e}")
+
+def _ollama_health_loop():
+    """Background thread that keeps the cached Ollama availability flag fresh"""
+    global _ollama_up
+    while True:
+        was_up = _ollama_up
+        try:
+            _ollama_up = check_ollama_availability()
+        except Exception as e:
+            logger.error(f"Error in Ollama health check: {str(e)}")
+            _ollama_up = False
         
-    # Build extraction prompt specifically for our job schema
-    prompt = """You are an AI assistant that extracts structured job information from job descriptions.
+        # Load the model whenever Ollama (re)appears, including at startup. A load
+        # can take minutes, so it runs on its own thread and the checks carry on
+        if _ollama_up and not was_up:
+            threading.Thread(target=warm_up_ollama, name='ollama-warm-up', daemon=True).start()
+        time.sleep(OLLAMA_HEALTH_INTERVAL)
+
+# Probe Ollama off the request path; handlers only read the cached flag
+threading.Thread(target=_ollama_health_loop, name='ollama-health', daemon=True).start()
+
+def _ollama_cache_key(job_description):
+    """Build a cache key from the model name and a digest of the prompt text"""
+    return (OLLAMA_MODEL, text_digest(job_description[:OLLAMA_MAX_DESC_LENGTH]))
+
+# Extraction prompt specifically for our job schema; the description is
+# placed between the prefix and suffix
+_EXTRACTION_PROMPT_PREFIX = """You are an AI assistant that extracts structured job information from job descriptions.
 
 Extract the following information from the job description and return it as valid JSON:
 
@@ -78,53 +212,224 @@ Rules:
 - If location suggests remote work, use 'remote' as jobLocation
 - Summarize the job description to focus on key responsibilities and requirements
 - Be concise and factual
-- Return ONLY valid JSON, no other text"""
+- Return ONLY valid JSON, no other text
 
-    # Truncate job description if too long
-    max_desc_length = 2000
-    if len(job_description) > max_desc_length:
-        job_description = job_description[:max_desc_length]
+JOB DESCRIPTION:
+'''
+"""
+_EXTRACTION_PROMPT_SUFFIX = "\n'''"
+
+def _num_predict_for(job_description):
+    """
+    Token budget for an extraction, scaled to the description length
+    
+    The summary can't be longer than the description itself, so short
+    inputs get a smaller cap (roughly 4 characters per token plus room for
+    the other fields) and runaway generations stop early.
+    
+    Args:
+        job_description (str): Truncated job description text
+        
+    Returns:
+        int: Value for Ollama's num_predict option
+    """
+    return min(MAX_TOKEN_GENERATION, 256 + len(job_description) // 4)
+
+def _read_json_body():
+    """
+    Parse the JSON request body without keeping a cached copy of the raw bytes
+    
+    Returns:
+        dict or None: Parsed body, or None if the request carries no JSON
+        
+    Raises:
+        RequestEntityTooLarge: If the body is over MAX_REQUEST_BODY_BYTES
+    """
+    if not request.is_json:
+        return None
+    raw = request.get_data(cache=False)
+    
+    # Chunked uploads carry no Content-Length to check up front
+    if len(raw) > MAX_REQUEST_BODY_BYTES:
+        raise RequestEntityTooLarge()
+    return orjson.loads(raw) if raw else None
+
+def _body_too_large_response():
+    """413 response for a request body over MAX_REQUEST_BODY_BYTES"""
+    return jsonify({
+        "success": False,
+        "error": f"Request body must be at most {MAX_REQUEST_BODY_BYTES} bytes"
+    }), 413
+
+def _ollama_circuit_open():
+    """Whether Ollama calls are currently being skipped after repeated failures"""
+    return time.monotonic() < _ollama_circuit_open_until
+
+def _record_ollama_result(succeeded):
+    """
+    Track Ollama call outcomes and open the circuit after repeated failures
+    
+    Args:
+        succeeded (bool): Whether the call returned generated text
+    """
+    global _ollama_circuit_open_until
+    with _ollama_circuit_lock:
+        if succeeded:
+            _ollama_failures.clear()
+            return
+        
+        now = time.monotonic()
+        _ollama_failures.append(now)
+        while _ollama_failures and now - _ollama_failures[0] > OLLAMA_FAILURE_WINDOW:
+            _ollama_failures.popleft()
         
+        if len(_ollama_failures) >= OLLAMA_FAILURE_THRESHOLD:
+            _ollama_failures.clear()
+            _ollama_circuit_open_until = now + OLLAMA_CIRCUIT_COOLDOWN
+            logger.error(f"Ollama failed {OLLAMA_FAILURE_THRESHOLD} times in {OLLAMA_FAILURE_WINDOW}s. "
+                         f"Using fallback extraction for {OLLAMA_CIRCUIT_COOLDOWN}s.")
+
+def _generate_with_ollama(job_description):
+    """
+    Run the extraction prompt through Ollama
+    
+    Args:
+        job_description (str): Truncated job description text
+        
+    Returns:
+        str: Generated text or None if the call failed
+    """
     try:
-        response = requests.post(
+        with SESSION.post(
             f"{OLLAMA_URL}/api/generate",
-            json={
+            data=orjson.dumps({
                 "model": OLLAMA_MODEL,
-                "prompt": f"{prompt}\n\nJOB DESCRIPTION:\n'''\n{job_description}\n'''",
-                "stream": False,
+                "prompt": _EXTRACTION_PROMPT_PREFIX + job_description + _EXTRACTION_PROMPT_SUFFIX,
+                "stream": True,
+                "keep_alive": OLLAMA_KEEP_ALIVE,
                 "options": {
                     "temperature": 0.1,
-                    "num_predict": 1024,
+                    "top_k": 10,
+                    "num_predict": _num_predict_for(job_description),
                 }
-            },
-            timeout=OLLAMA_TIMEOUT
-        )
-        
-        if response.status_code != 200:
-            logger.error(f"Error from Ollama API: {response.text}")
-            return None
+            }),
+            headers={'Content-Type': 'application/json'},
+            timeout=(5, OLLAMA_TIMEOUT),
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                logger.error(f"Error from Ollama API: {response.text}")
+                return None
             
-        result = response.json()
-        generated_text = result.get('response', '')
+            # Collect the NDJSON chunks as Ollama generates them
+            chunks = []
+            tracker = JsonObjectTracker()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                try:
+                    chunk = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.error("Received malformed stream chunk from Ollama")
+                    return None
+                if 'error' in chunk:
+                    logger.error(f"Error from Ollama API: {chunk['error']}")
+                    return None
+                piece = chunk.get('response', '')
+                chunks.append(piece)
+                if chunk.get('done'):
+                    break
+                # Only the first valid JSON object is used, so stop once it is complete;
+                # braces in any lead-in prose close too, so the text has to parse
+                if tracker.feed(piece) and extract_json_block(''.join(chunks)):
+                    break
         
-        # Try to extract JSON from response
-        try:
-            # Look for JSON block
-            json_match = re.search(r'```json\s*([\s\S]*?)\s*```|{\s*"[\w]+"\s*:[\s\S]*}', generated_text)
-            if json_match:
-                json_str = json_match.group(1) or json_match.group(0)
-                return json.loads(json_str)
-            else:
-                # Try to parse entire response as JSON
-                return json.loads(generated_text)
-        except json.JSONDecodeError:
-            logger.error("Failed to parse JSON from Ollama response")
-            return None
+        return ''.join(chunks)
                 
     except requests.RequestException as e:
         logger.error(f"Error communicating with Ollama: {e}")
         return None
 
+def extract_with_ollama(job_description):
+    """
+    Extract job data using Ollama model
+    
+    Args:
+        job_description (str): Job description text
+        
+    Returns:
+        dict: Extracted job data or None if processing failed
+    """
+    # Identical descriptions are served from cache without touching Ollama,
+    # and concurrent requests for the same description share one call
+    return ollama_cache.get_or_compute(
+        _ollama_cache_key(job_description),
+        lambda: _run_ollama_extraction(job_description),
+        timeout=OLLAMA_TIMEOUT
+    )
+
+def _run_ollama_extraction(job_description):
+    """
+    Run an uncached Ollama extraction
+    
+    Args:
+        job_description (str): Job description text
+        
+    Returns:
+        dict: Extracted job data or None if processing failed
+    """
+    if not _ollama_up:
+        logger.warning("Ollama is not available. Using fallback methods.")
+        return None
+    
+    if _ollama_circuit_open():
+        logger.warning("Ollama is failing repeatedly. Using fallback methods.")
+        return None
+        
+    # Truncate job description if too long
+    if len(job_description) > OLLAMA_MAX_DESC_LENGTH:
+        job_description = job_description[:OLLAMA_MAX_DESC_LENGTH]
+    
+    # Shed load instead of queueing behind slow generations
+    if not _ollama_slots.acquire(timeout=OLLAMA_QUEUE_TIMEOUT):
+        logger.warning("Too many concurrent Ollama requests. Using fallback methods.")
+        return None
+    try:
+        generated_text = _generate_with_ollama(job_description)
+    finally:
+        _ollama_slots.release()
+    
+    _record_ollama_result(generated_text is not None)
+    if generated_text is None:
+        return None
+        
+    # Try to extract JSON from response
+    try:
+        # Look for JSON block
+        json_str = extract_json_block(generated_text)
+        if json_str:
+            data = orjson.loads(json_str)
+        else:
+            # Try to parse entire response as JSON
+            data = orjson.loads(generated_text)
+        
+        return data
+    except orjson.JSONDecodeError:
+        logger.error("Failed to parse JSON from Ollama response")
+        return None
+
+def extract_many_with_ollama(job_descriptions):
+    """
+    Extract job data for several job descriptions with overlapping Ollama calls
+    
+    Args:
+        job_descriptions (list): Job description texts
+        
+    Returns:
+        list: Extracted job data (or None) for each description, in input order
+    """
+    return list(_OLLAMA_EXECUTOR.map(extract_with_ollama, job_descriptions))
+
 def fallback_extraction(job_description):
     """
     Fallback extraction using rule-based methods when Ollama is unavailable
@@ -136,17 +441,12 @@ def fallback_extraction(job_description):
         dict: Extracted job data using simple pattern matching
     """
     text_lower = job_description.lower()
+    is_remote = 'remote' in text_lower
     
-    # Company extraction patterns
+    # Company extraction
     company = ""
-    company_patterns = [
-        r'(?:company|organization|employer)[\s:]+([A-Za-z0-9\s\-\&\.]+)',
-        r'(?:at|with|for|by)\s+([A-Za-z0-9\s\-\&\.]+?)(?:\s+is|\s+are|\s+has|\s+have)',
-        r'about\s+([A-Za-z0-9\s\-\&\.]+?)(?:\n|\.|,|:)'
-    ]
-    
-    for pattern in company_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _COMPANY_PATTERNS:
+        match = pattern.search(job_description)
         if match:
             company = match.group(1).strip()
             if 3 < len(company) < 50:
@@ -154,13 +454,8 @@ def fallback_extraction(job_description):
     
     # Position extraction
     position = ""
-    position_patterns = [
-        r'(?:job title|position|role|job)[\s:]+([A-Za-z0-9\s\-\&\/\(\)\,\.]+)',
-        r'hiring(?:[\s:]+)(?:a|an)?(?:[\s:]+)([A-Za-z0-9\s\-\&\/\(\)]+)',
-    ]
-    
-    for pattern in position_patterns:
-        match = re.search(pattern, text_lower)
+    for pattern in _POSITION_PATTERNS:
+        match = pattern.search(job_description)
         if match:
             position = match.group(1).strip()
             if 3 < len(position) < 100:
@@ -168,16 +463,11 @@ def fallback_extraction(job_description):
     
     # Location extraction
     location = "remote"
-    if any(term in text_lower for term in ['remote', 'work from home', 'wfh']):
+    if is_remote or 'work from home' in text_lower or 'wfh' in text_lower:
         location = "remote"
     else:
-        location_patterns = [
-            r'(?:location|based\s+in|located\s+in)[\s:]+([A-Za-z0-9\s\-\,\.]+)',
-            r'(?:in|at)\s+([A-Za-z]+(?:\s*,\s*[A-Za-z]+)?)'
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _LOCATION_PATTERNS:
+            match = pattern.search(job_description)
             if match:
                 location = match.group(1).strip()
                 if 2 < len(location) < 50:
@@ -191,7 +481,7 @@ def fallback_extraction(job_description):
         job_type = "contract"
     elif 'intern' in text_lower:
         job_type = "internship"
-    elif 'remote' in text_lower:
+    elif is_remote:
         job_type = "remote"
     
     # Salary extraction
@@ -206,29 +496,21 @@ def fallback_extraction(job_description):
     elif "£" in job_description or "gbp" in text_lower:
         currency = "GBP"
     
-    # Look for salary patterns
-    salary_patterns = [
-        r'(\d+(?:,\d+)?)\s*(?:k|K|thousand)?\s*(?:-|to|–)\s*(\d+(?:,\d+)?)\s*(?:k|K|thousand)?',
-        r'(?:salary|compensation|pay).*?(\d+(?:,\d+)?)'
-    ]
-    
-    for pattern in salary_patterns:
-        match = re.search(pattern, job_description)
-        if match:
-            if len(match.groups()) == 2:
-                min_sal = int(match.group(1).replace(',', ''))
-                max_sal = int(match.group(2).replace(',', ''))
-                
-                # Check for 'k' multiplier
-                if 'k' in match.group(0).lower():
-                    min_sal *= 1000
-                    max_sal *= 1000
-                    
-                salary = {"min": min_sal, "max": max_sal, "currency": currency}
-            break
+    # Look for a salary range
+    match = _SALARY_RANGE_PATTERN.search(job_description)
+    if match:
+        min_sal = int(match.group(1).replace(',', ''))
+        max_sal = int(match.group(2).replace(',', ''))
+        
+        # Check for 'k' multiplier
+        if 'k' in match.group(0).lower():
+            min_sal *= 1000
+            max_sal *= 1000
+            
+        salary = {"min": min_sal, "max": max_sal, "currency": currency}
     
     # Summary (take first 500 words)
-    words = job_description.split()
+    words = job_description.split(None, 100)
     summary = ' '.join(words[:100]) if len(words) > 100 else job_description
     
     return {
@@ -250,9 +532,10 @@ def index():
         "service": "Job Data Extraction Service",
         "version": "1.0.0",
         "endpoints": {
-            "/api/extract-job-data": "POST - Extract structured data from job description"
+            "/api/extract-job-data": "POST - Extract structured data from job description",
+            "/api/extract-job-data/batch": "POST - Extract structured data from multiple job descriptions"
         },
-        "ollama_available": check_ollama_availability()
+        "ollama_available": _ollama_up
     })
 
 @app.route('/api/extract-job-data', methods=['POST'])
@@ -283,14 +566,17 @@ def extract_job_data():
             "processing_time_ms": number
         }
     """
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
+    
+    if request.content_length and request.content_length > MAX_REQUEST_BODY_BYTES:
+        return _body_too_large_response()
     
     try:
-        request_data = request.json
+        request_data = _read_json_body()
         
         if not request_data:
             return jsonify({
-                "success": false,
+                "success": False,
                 "error": "No data provided"
             }), 400
         
@@ -299,7 +585,7 @@ def extract_job_data():
         
         if not job_description or len(job_description.strip()) < 50:
             return jsonify({
-                "success": false,
+                "success": False,
                 "error": "Job description is required and must be at least 50 characters"
             }), 400
         
@@ -318,16 +604,18 @@ def extract_job_data():
             processed_by = "fallback"
         
         # Add processing metadata
-        processing_time = time.time() - start_time
+        processing_time_ns = time.perf_counter_ns() - start_time
         
         return jsonify({
             "success": True,
             "data": extracted_data,
             "processed_by": processed_by,
-            "processing_time_ms": round(processing_time * 1000),
+            "processing_time_ms": round(processing_time_ns / 1_000_000),
             "timestamp": datetime.now().isoformat()
         }), 200
         
+    except RequestEntityTooLarge:
+        return _body_too_large_response()
     except Exception as e:
         logger.error(f"Error processing job data: {str(e)}")
         return jsonify({
@@ -336,6 +624,111 @@ def extract_job_data():
             "details": str(e)
         }), 500
 
+@app.route('/api/extract-job-data/batch', methods=['POST'])
+def extract_job_data_batch():
+    """
+    Extract structured job data from several job descriptions in one call.
+    Ollama requests for the batch are dispatched concurrently.
+    
+    Accepts:
+        {
+            "jobDescriptions": ["string - job description text", ...],
+            "useLLM": "boolean - whether to use Ollama LLM (optional, default: true)"
+        }
+        
+    Returns:
+        {
+            "success": true,
+            "results": [
+                {"success": true, "data": {...}, "processed_by": "ollama|fallback"},
+                {"success": false, "error": "string"}
+            ],
+            "processing_time_ms": number
+        }
+    """
+    start_time = time.perf_counter_ns()
+    
+    if request.content_length and request.content_length > MAX_REQUEST_BODY_BYTES:
+        return _body_too_large_response()
+    
+    try:
+        request_data = _read_json_body()
+        
+        if not request_data:
+            return jsonify({
+                "success": False,
+                "error": "No data provided"
+            }), 400
+        
+        job_descriptions = request_data.get('jobDescriptions')
+        use_llm = request_data.get('useLLM', True)
+        
+        if not isinstance(job_descriptions, list) or not job_descriptions:
+            return jsonify({
+                "success": False,
+                "error": "jobDescriptions must be a non-empty list"
+            }), 400
+        
+        if len(job_descriptions) > MAX_BATCH_SIZE:
+            return jsonify({
+                "success": False,
+                "error": f"A batch may contain at most {MAX_BATCH_SIZE} job descriptions"
+            }), 400
+        
+        valid = [
+            isinstance(description, str) and len(description.strip()) >= 50
+            for description in job_descriptions
+        ]
+        
+        # Send every valid description to Ollama at once so the calls overlap
+        llm_results = iter([])
+        if use_llm:
+            llm_results = iter(extract_many_with_ollama(
+                [description for description, ok in zip(job_descriptions, valid) if ok]
+            ))
+        
+        results = []
+        for description, ok in zip(job_descriptions, valid):
+            if not ok:
+                results.append({
+                    "success": False,
+                    "error": "Job description is required and must be at least 50 characters"
+                })
+                continue
+            
+            extracted_data = next(llm_results, None)
+            processed_by = "ollama"
+            
+            # Fallback to rule-based extraction if Ollama failed
+            if not extracted_data:
+                extracted_data = fallback_extraction(description)
+                processed_by = "fallback"
+            
+            results.append({
+                "success": True,
+                "data": extracted_data,
+                "processed_by": processed_by
+            })
+        
+        processing_time_ns = time.perf_counter_ns() - start_time
+        
+        return jsonify({
+            "success": True,
+            "results": results,
+            "processing_time_ms": round(processing_time_ns / 1_000_000),
+            "timestamp": datetime.now().isoformat()
+        }), 200
+        
+    except RequestEntityTooLarge:
+        return _body_too_large_response()
+    except Exception as e:
+        logger.error(f"Error processing job data batch: {str(e)}")
+        return jsonify({
+            "success": False,
+            "error": "Failed to process job data batch",
+            "details": str(e)
+        }), 500
+
 if __name__ == '__main__':
     # Get configuration from environment variables
     host = os.environ.get('HOST', '0.0.0.0')
@@ -349,5 +742,8 @@ if __name__ == '__main__':
     else:
         logger.warning(f"Ollama is not available at {OLLAMA_URL}. Using fallback extraction only.")
     
+    if not debug:
+        logger.warning("Running on the Flask development server. Use 'gunicorn --config gunicorn.conf.py app:app' in production.")
+    
     logger.info(f"Starting Job Data Extraction Service on {host}:{port}")
     app.run(host=host, port=port, debug=debug)
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Gunicorn configuration for the Job Data Extraction Service.
+
+Uses threaded workers so a request waiting on Ollama doesn't block the
+other requests handled by the same worker.
+"""
+import os
+
+# Server socket
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', 5000)}"
+
+# Worker processes. Requests mostly wait on Ollama and threads already serve them
+# concurrently, so a couple of processes is enough. Each worker limits its own
+# Ollama calls; the app splits OLLAMA_NUM_PARALLEL across this many workers
+workers = int(os.environ.get('GUNICORN_WORKERS', 2))
+os.environ['GUNICORN_WORKERS'] = str(workers)
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+
+# Concurrent clients per worker when GUNICORN_WORKER_CLASS=gevent; the gevent
+# worker patches the standard library itself, so Ollama calls yield while waiting
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 1000))
+
+# Ollama calls can take minutes, keep this above OLLAMA_TIMEOUT
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 300))
+keepalive = 5
+
+# Logging
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
@@ -4,12 +4,27 @@ services/cache_manager.py - Simple in-memory cache with TTL support
 Provides caching capabilities to reduce processing load and improve response times.
 """
 import time
+import hashlib
+import heapq
+import itertools
 import threading
 import logging
 from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+def text_digest(text):
+    """
+    Build a compact cache key for a piece of text.
+    
+    Args:
+        text (str): Text to key on
+        
+    Returns:
+        bytes: 16-byte BLAKE2b digest of the text, so large texts aren't retained as keys
+    """
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
 class CacheManager:
     """
     Thread-safe in-memory cache with TTL (time-to-live) support.
@@ -29,7 +44,17 @@ class CacheManager:
         self.cache = OrderedDict()  # {key: (value, timestamp)}
         self.lock = threading.RLock()
         
-        # Start background cleaner thread if TTL is set
+        # Events for keys currently being computed by get_or_compute
+        self._inflight = {}
+        
+        # Min-heap of (timestamp, seq, key) in expiry order; entries whose
+        # timestamp no longer matches the cached one are stale and skipped
+        self._expiry_heap = []
+        self._expiry_seq = itertools.count()
+        
+        # Start background cleaner thread if TTL is set; close() stops it
+        self._stop = threading.Event()
+        self.cleaner = None
         if ttl > 0:
             self.cleaner = threading.Thread(target=self._clean_expired, daemon=True)
             self.cleaner.start()
@@ -72,11 +97,14 @@ class CacheManager:
             True if set successfully
         """
         with self.lock:
+            now = time.time()
+            
             # Check if key exists already
             if key in self.cache:
                 # Update existing entry
-                self.cache[key] = (value, time.time())
+                self.cache[key] = (value, now)
                 self.cache.move_to_end(key)
+                self._track_expiry(key, now)
                 return True
                 
             # If cache is full, remove least recently used item
@@ -84,10 +112,76 @@ class CacheManager:
                 self.cache.popitem(last=False)
                 
             # Add new item
-            self.cache[key] = (value, time.time())
+            self.cache[key] = (value, now)
+            self._track_expiry(key, now)
             
             return True
     
+    def get_or_compute(self, key, producer, timeout=None):
+        """
+        Get value from cache, computing it once on a miss.
+        
+        Concurrent callers missing on the same key wait for the first one
+        instead of all running producer. None results are not cached; if
+        the first caller produces nothing (or the wait times out) a waiter
+        computes the value itself.
+        
+        Args:
+            key: Cache key
+            producer (callable): Function returning the value to cache
+            timeout (float): Maximum seconds to wait for another caller
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+        
+        with self.lock:
+            event = self._inflight.get(key)
+            if event is None:
+                event = self._inflight[key] = threading.Event()
+                owner = True
+            else:
+                owner = False
+        
+        if not owner:
+            event.wait(timeout)
+            value = self.get(key)
+            return value if value is not None else producer()
+        
+        try:
+            value = producer()
+            if value is not None:
+                self.set(key, value)
+            return value
+        finally:
+            with self.lock:
+                self._inflight.pop(key, None)
+            event.set()
+    
+    def _track_expiry(self, key, timestamp):
+        """
+        Record when a cached item expires. Must be called with the lock held.
+        
+        Args:
+            key: Cache key
+            timestamp (float): Time the item was stored
+        """
+        if self.ttl <= 0:
+            return
+            
+        heapq.heappush(self._expiry_heap, (timestamp, next(self._expiry_seq), key))
+        
+        # Drop stale entries left by overwrites, deletes and LRU evictions
+        if len(self._expiry_heap) > 2 * self.max_size + 100:
+            self._expiry_heap = [
+                entry for entry in self._expiry_heap
+                if entry[2] in self.cache and self.cache[entry[2]][1] == entry[0]
+            ]
+            heapq.heapify(self._expiry_heap)
+    
     def delete(self, key):
         """
         Delete item from cache.
@@ -108,22 +202,43 @@ class CacheManager:
         """Clear all items from cache."""
         with self.lock:
             self.cache.clear()
+            self._expiry_heap.clear()
+    
+    def close(self):
+        """Stop the background cleaner thread. Cached items stay readable."""
+        self._stop.set()
+        if self.cleaner is not None:
+            self.cleaner.join()
     
     def _clean_expired(self):
         """Background thread to clean expired items."""
+        delay = min(self.ttl / 2, 300)
         while True:
             try:
-                time.sleep(min(self.ttl / 2, 300))  # Clean at half TTL or max 5 minutes
+                if self._stop.wait(delay):
+                    return
                 
                 with self.lock:
                     now = time.time()
-                    expired_keys = [k for k, (_, ts) in self.cache.items() if now - ts > self.ttl]
+                    removed = 0
+                    
+                    # Only the heap head can be due, so stop at the first live item
+                    while self._expiry_heap and now - self._expiry_heap[0][0] > self.ttl:
+                        timestamp, _, key = heapq.heappop(self._expiry_heap)
+                        entry = self.cache.get(key)
+                        if entry is not None and entry[1] == timestamp:
+                            del self.cache[key]
+                            removed += 1
                     
-                    for key in expired_keys:
-                        del self.cache[key]
+                    # Sleep until the next item is due (at least 1s, at most 5 minutes)
+                    if self._expiry_heap:
+                        delay = self._expiry_heap[0][0] + self.ttl - now
+                    else:
+                        delay = self.ttl
+                    delay = min(max(delay, 1), 300)
                         
-                    if expired_keys:
-                        logger.debug(f"Removed {len(expired_keys)} expired items from cache")
+                    if removed:
+                        logger.debug(f"Removed {removed} expired items from cache")
             
             except Exception as e:
                 logger.error(f"Error in cache cleaner: {str(e)}")
@@ -137,11 +252,20 @@ class CacheManager:
         """
         with self.lock:
             now = time.time()
+            
+            # One pass for both ends of the age range
+            oldest = newest = None
+            for _, ts in self.cache.values():
+                if oldest is None or ts < oldest:
+                    oldest = ts
+                if newest is None or ts > newest:
+                    newest = ts
+            
             return {
                 'size': len(self.cache),
                 'max_size': self.max_size,
                 'ttl': self.ttl,
                 'utilization': len(self.cache) / self.max_size if self.max_size > 0 else 0,
-                'oldest_item_age': max([now - ts for _, ts in self.cache.values()]) if self.cache else 0,
-                'newest_item_age': min([now - ts for _, ts in self.cache.values()]) if self.cache else 0,
+                'oldest_item_age': now - oldest if self.cache else 0,
+                'newest_item_age': now - newest if self.cache else 0,
             }
\ No newline at end of file
@@ -1,9 +1,9 @@
 """
 Job data extraction service - core business logic for extracting structured job data.
 """
-from functools import lru_cache
 import logging
-from utils.html_utils import extract_text_from_html, extract_job_url, extract_metadata_fields
+from services.cache_manager import CacheManager, text_digest
+from utils.html_utils import parse_html_once
 from utils.regex_extractors import (
     extract_job_title, extract_company, extract_location, 
     extract_job_type, extract_salary, extract_description
@@ -11,11 +11,46 @@ from utils.regex_extractors import (
 
 logger = logging.getLogger(__name__)
 
-@lru_cache(maxsize=100)  # Cache results for performance
+# Substrings that mark a posting as remote when no location was extracted
+_REMOTE_TERMS = ("remote", "work from home", "wfh")
+
+# Cache results for performance, keyed by a digest so large HTML blobs aren't retained
+_content_cache = CacheManager(max_size=100, ttl=3600)
+
+def _content_cache_key(content, is_html):
+    """
+    Build the cache key for a piece of job content.
+    
+    Args:
+        content (str): HTML or text content from job posting
+        is_html (bool): Flag indicating if content is HTML
+        
+    Returns:
+        tuple: 16-byte BLAKE2b digest of the content and the HTML flag
+    """
+    return (text_digest(content), bool(is_html))
+
 def process_job_content(content, is_html=True):
     """
     Process job posting content and extract structured data.
     
+    Args:
+        content (str): HTML or text content from job posting
+        is_html (bool): Flag indicating if content is HTML (True) or plain text (False)
+        
+    Returns:
+        dict: Structured job data including company, position, location, etc.
+    """
+    # Concurrent calls with the same content share one extraction
+    return _content_cache.get_or_compute(
+        _content_cache_key(content, is_html),
+        lambda: _extract_job_content(content, is_html)
+    )
+
+def _extract_job_content(content, is_html):
+    """
+    Extract structured data from job posting content without caching.
+    
     Args:
         content (str): HTML or text content from job posting
         is_html (bool): Flag indicating if content is HTML (True) or plain text (False)
@@ -41,17 +76,14 @@ def process_job_content(content, is_html=True):
     }
     
     try:
-        # Step 1: Extract metadata if HTML
+        # Steps 1 and 2: Extract metadata and clean text if HTML, from a single parse
+        clean_text = content
         if is_html:
-            metadata = extract_metadata_fields(content)
+            metadata, clean_text, result["jobUrl"] = parse_html_once(content)
             result["position"] = metadata["title"]
             result["company"] = metadata["company"]
             result["jobLocation"] = metadata["location"]
             result["jobDescription"] = metadata["description"]
-            result["jobUrl"] = extract_job_url(content)
-        
-        # Step 2: Extract clean text from HTML if needed
-        clean_text = extract_text_from_html(content) if is_html else content
         
         # Step 3: Use rule-based extraction on the clean text
         # Only overwrite fields if they're empty or enhance with better data
@@ -155,6 +187,27 @@ def merge_job_data(html_data, text_data):
     logger.info("Job data merging completed successfully")
     return merged_data
 
+def _first_non_empty_line(text):
+    """
+    Find the first line of text that is not blank, without splitting the whole text.
+    
+    Args:
+        text (str): Text to scan
+        
+    Returns:
+        str: First non-empty line, stripped, or an empty string if there is none
+    """
+    start = 0
+    while start < len(text):
+        end = text.find('\n', start)
+        if end == -1:
+            end = len(text)
+        line = text[start:end].strip()
+        if line:
+            return line
+        start = end + 1
+    return ""
+
 def clean_and_validate_job_data(job_data, full_text):
     """
     Clean and validate extracted job data, filling in defaults if needed.
@@ -169,12 +222,10 @@ def clean_and_validate_job_data(job_data, full_text):
     # Clean position
     if not job_data["position"]:
         # Try to use the first non-empty line as a fallback for position
-        lines = [line.strip() for line in full_text.split('\n') if line.strip()]
-        if lines:
-            first_line = lines[0]
-            # Only use first line if it's reasonably short
-            if len(first_line) < 100:
-                job_data["position"] = first_line
+        first_line = _first_non_empty_line(full_text)
+        # Only use first line if it's reasonably short
+        if first_line and len(first_line) < 100:
+            job_data["position"] = first_line
     
     # Ensure position doesn't exceed a reasonable length
     if job_data["position"] and len(job_data["position"]) > 100:
@@ -187,7 +238,8 @@ def clean_and_validate_job_data(job_data, full_text):
     # Set default job location if not extracted
     if not job_data["jobLocation"]:
         # If the text contains remote work indicators, set as remote
-        if any(term in full_text.lower() for term in ["remote", "work from home", "wfh"]):
+        full_text_lower = full_text.lower()
+        if any(term in full_text_lower for term in _REMOTE_TERMS):
             job_data["jobLocation"] = "Remote"
     
     # Ensure the job description doesn't contain the entire text if it's too long
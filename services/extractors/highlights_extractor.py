@@ -6,29 +6,45 @@ in notes, such as benefits, company culture, growth opportunities, etc.
 """
 import re
 import logging
+from services.cache_manager import CacheManager, text_digest
 
 logger = logging.getLogger(__name__)
 
-# Patterns to identify different sections
+# Results are deterministic per text, so cache them keyed by a digest of the text
+_highlights_cache = CacheManager(max_size=64, ttl=3600)
+
+# Patterns to identify different sections. Each starts with a literal newline
+# rather than (?:^|\n) so the regex engine can skip ahead to candidate lines;
+# extract_from_section prepends a newline to match a heading on line one
 BENEFITS_PATTERNS = [
-    re.compile(r'(?:^|\n)(?:benefits|perks|what\s+we\s+offer|compensation|package|what\s+you\'ll\s+get)[:\s]*\n', re.IGNORECASE),
-    re.compile(r'(?:^|\n)(?:we\s+offer|you\'ll\s+receive)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:benefits|perks|what\s+we\s+offer|compensation|package|what\s+you\'ll\s+get)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:we\s+offer|you\'ll\s+receive)[:\s]*\n', re.IGNORECASE),
 ]
 
 CULTURE_PATTERNS = [
-    re.compile(r'(?:^|\n)(?:our\s+culture|about\s+us|who\s+we\s+are|company\s+culture|team\s+culture|working\s+at)[:\s]*\n', re.IGNORECASE),
-    re.compile(r'(?:^|\n)(?:why\s+join\s+us|why\s+work\s+(?:for|with)\s+us)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:our\s+culture|about\s+us|who\s+we\s+are|company\s+culture|team\s+culture|working\s+at)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:why\s+join\s+us|why\s+work\s+(?:for|with)\s+us)[:\s]*\n', re.IGNORECASE),
 ]
 
 GROWTH_PATTERNS = [
-    re.compile(r'(?:^|\n)(?:growth|career|advancement|development|opportunities|learning)[:\s]*\n', re.IGNORECASE),
-    re.compile(r'(?:^|\n)(?:what\s+you\'ll\s+learn|how\s+you\'ll\s+grow)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:growth|career|advancement|development|opportunities|learning)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:what\s+you\'ll\s+learn|how\s+you\'ll\s+grow)[:\s]*\n', re.IGNORECASE),
 ]
 
 RESPONSIBILITY_PATTERNS = [
-    re.compile(r'(?:^|\n)(?:responsibilities|duties|what\s+you\'ll\s+do|role|job\s+description|day-to-day)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:responsibilities|duties|what\s+you\'ll\s+do|role|job\s+description|day-to-day)[:\s]*\n', re.IGNORECASE),
 ]
 
+# End of a section: a blank line or the next ALL-CAPS heading
+SECTION_END_PATTERN = re.compile(r'\n\s*\n|\n[A-Z][^a-z\n]+:')
+
+# Bullet items (• - * · etc.) at the start of a line. Callers prepend a newline
+# to the text so the pattern can begin with a literal instead of (?:^|\n).
+BULLET_PATTERN = re.compile(r'\n[•\-*·]\s*([^\n•\-*·]+)')
+
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 # Important keywords to look for
 BENEFIT_KEYWORDS = [
     'health insurance', 'dental', 'vision', 'medical', '401k', 'retirement', 
@@ -52,6 +68,38 @@ IMPORTANT_HIGHLIGHTS = [
     '4-day work week', 'unlimited vacation', 'remote-first', 'distributed team',
 ]
 
+# Lowercased once at import so keyword checks don't re-lower on every comparison
+_IMPORTANT_HIGHLIGHTS_LOWER = tuple(keyword.lower() for keyword in IMPORTANT_HIGHLIGHTS)
+_BENEFIT_KEYWORDS_LOWER = tuple((benefit, benefit.lower()) for benefit in BENEFIT_KEYWORDS)
+
+# Groups of related benefit terms, used to collapse similar mentions
+BENEFIT_GROUPS = [
+    {'health insurance', 'medical', 'health', 'healthcare'},
+    {'dental', 'vision'},
+    {'401k', 'retirement'},
+    {'PTO', 'paid time off', 'vacation', 'holidays', 'sick leave'},
+    {'parental leave', 'maternity', 'paternity'},
+    {'bonus', 'stock options', 'equity'},
+    {'flexible hours', 'flexible schedule', 'work-life balance'},
+    {'remote work', 'work from home', 'WFH', 'hybrid'},
+    {'gym', 'fitness', 'wellness', 'mental health'},
+    {'education', 'tuition', 'professional development', 'training'}
+]
+
+# Standardized terms for each group
+BENEFIT_GROUP_NAMES = [
+    'Health insurance',
+    'Dental & vision',
+    'Retirement plan',
+    'Paid time off',
+    'Parental leave',
+    'Performance bonuses/equity',
+    'Flexible schedule',
+    'Remote/hybrid work',
+    'Wellness programs',
+    'Education & development'
+]
+
 def extract_highlights(text, max_highlights=5):
     """
     Extract key highlights from a job description.
@@ -65,9 +113,28 @@ def extract_highlights(text, max_highlights=5):
     """
     if not text:
         return []
+    
+    highlights = _highlights_cache.get_or_compute(
+        (text_digest(text), max_highlights),
+        lambda: _extract_highlights(text, max_highlights)
+    )
+    # Hand out a copy so callers can't modify the cached list
+    return list(highlights)
+
+def _extract_highlights(text, max_highlights):
+    """
+    Extract key highlights from a job description without caching.
+    
+    Args:
+        text (str): Job description text
+        max_highlights (int): Maximum number of highlights to extract
         
+    Returns:
+        list: Extracted highlights as list of strings
+    """
     try:
         highlights = []
+        text_lower = text.lower()
         
         # Extract from specific sections first
         benefits = extract_from_section(text, BENEFITS_PATTERNS)
@@ -87,7 +154,7 @@ def extract_highlights(text, max_highlights=5):
         highlights.extend(bullet_highlights)
         
         # Look for specific benefit keywords
-        benefit_highlights = extract_benefit_mentions(text)
+        benefit_highlights = extract_benefit_mentions(text, text_lower)
         highlights.extend(benefit_highlights)
         
         # Extract any mentions of important keywords
@@ -112,15 +179,18 @@ def extract_from_section(text, patterns):
     Returns:
         str: Extracted section content or empty string
     """
+    # Section patterns need a newline before the first line too
+    text = '\n' + text
+    
     for pattern in patterns:
         match = pattern.search(text)
         if match:
             start_pos = match.end()
             # Find the end of this section (next section heading or double newline)
-            end_match = re.search(r'\n\s*\n|\n[A-Z][^a-z\n]+:', text[start_pos:])
+            end_match = SECTION_END_PATTERN.search(text, start_pos)
             
             if end_match:
-                section_text = text[start_pos:start_pos + end_match.start()]
+                section_text = text[start_pos:end_match.start()]
             else:
                 # Take next 250 characters if no clear end found
                 section_text = text[start_pos:start_pos + 250]
@@ -139,7 +209,7 @@ def clean_section_text(text):
         return ""
         
     # Remove excess whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
     
     # If text is too long, truncate it
     if len(text) > 150:
@@ -164,44 +234,50 @@ def extract_from_bullets(text):
     highlights = []
     
     # Match bullet points (• - * · etc.)
-    bullet_items = re.findall(r'(?:^|\n)[•\-*·]\s*([^\n•\-*·]+)', text)
+    bullet_items = BULLET_PATTERN.findall('\n' + text)
     
     for item in bullet_items:
         item = item.strip()
         
         # Skip very short items or items that look like section headings
-        if len(item) < 5 or item.isupper() or item.endswith(':'):
+        if len(item) < 5 or item.endswith(':') or item.isupper():
             continue
             
         # Check if bullet contains important keywords
-        if any(keyword.lower() in item.lower() for keyword in IMPORTANT_HIGHLIGHTS):
+        item_lower = item.lower()
+        if any(keyword in item_lower for keyword in _IMPORTANT_HIGHLIGHTS_LOWER):
             # Clean and format
             if len(item) > 100:
                 item = item[:97] + "..."
                 
             highlights.append(item)
+            # Only the top bullets are returned, so stop once we have them
+            if len(highlights) == 3:
+                break
             
     # Return top bullets
-    return highlights[:3]  # Limit to 3 bullet points
+    return highlights
 
-def extract_benefit_mentions(text):
+def extract_benefit_mentions(text, text_lower=None):
     """
     Extract mentions of benefits from the text.
     
     Args:
         text (str): Text to extract from
+        text_lower (str): Lowercased text, if the caller already has it
         
     Returns:
         list: List of benefit highlights
     """
     highlights = []
-    text_lower = text.lower()
+    if text_lower is None:
+        text_lower = text.lower()
     
     # Check for specific benefits
-    found_benefits = []
-    for benefit in BENEFIT_KEYWORDS:
-        if benefit.lower() in text_lower:
-            found_benefits.append(benefit)
+    found_benefits = [
+        benefit for benefit, benefit_lower in _BENEFIT_KEYWORDS_LOWER
+        if benefit_lower in text_lower
+    ]
     
     # Group similar benefits
     grouped_benefits = group_similar_items(found_benefits)
@@ -215,6 +291,14 @@ def extract_benefit_mentions(text):
     
     return highlights
 
+def _iter_sentences(text):
+    """Yield the same pieces as SENTENCE_SPLIT_PATTERN.split(text), one at a time."""
+    start = 0
+    for match in SENTENCE_SPLIT_PATTERN.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
 def extract_keyword_mentions(text):
     """
     Extract mentions of important keywords from text.
@@ -226,32 +310,38 @@ def extract_keyword_mentions(text):
         list: List of keyword-based highlights
     """
     highlights = []
-    text_lower = text.lower()
-    
-    # Look for important highlight phrases
-    sentences = re.split(r'(?<=[.!?])\s+', text)
     
-    for sentence in sentences:
+    # Look for important highlight phrases, splitting lazily so we can stop
+    # as soon as we have enough
+    for sentence in _iter_sentences(text):
         # Skip very short or very long sentences
         if len(sentence) < 10 or len(sentence) > 150:
             continue
             
         # Check if sentence contains important keywords
-        contains_keyword = False
-        for keyword in IMPORTANT_HIGHLIGHTS:
-            if keyword.lower() in sentence.lower():
-                contains_keyword = True
-                break
-                
-        if contains_keyword:
+        sentence_lower = sentence.lower()
+        if any(keyword in sentence_lower for keyword in _IMPORTANT_HIGHLIGHTS_LOWER):
             # Clean and format
             cleaned = sentence.strip()
             if not cleaned.endswith(('.', '!', '?')):
                 cleaned += '.'
             highlights.append(cleaned)
+            # Only the top 2 sentences are returned, so stop once we have them
+            if len(highlights) == 2:
+                break
     
-    # Return top sentences
-    return highlights[:2]  # Limit to 2 sentences
+    return highlights
+
+def _matching_groups(item):
+    """Indexes of the benefit groups with a term contained in item, in group order."""
+    item_lower = item.lower()
+    return tuple(
+        i for i, group in enumerate(BENEFIT_GROUPS)
+        if any(term in item_lower for term in group)
+    )
+
+# Matching groups for every benefit keyword, computed once
+_BENEFIT_KEYWORD_GROUPS = {benefit: _matching_groups(benefit) for benefit in BENEFIT_KEYWORDS}
 
 def group_similar_items(items):
     """
@@ -265,61 +355,30 @@ def group_similar_items(items):
     """
     if not items:
         return []
-        
-    # Define groups of related terms
-    groups = [
-        {'health insurance', 'medical', 'health', 'healthcare'},
-        {'dental', 'vision'},
-        {'401k', 'retirement'},
-        {'PTO', 'paid time off', 'vacation', 'holidays', 'sick leave'},
-        {'parental leave', 'maternity', 'paternity'},
-        {'bonus', 'stock options', 'equity'},
-        {'flexible hours', 'flexible schedule', 'work-life balance'},
-        {'remote work', 'work from home', 'WFH', 'hybrid'},
-        {'gym', 'fitness', 'wellness', 'mental health'},
-        {'education', 'tuition', 'professional development', 'training'}
-    ]
     
-    # Standardized terms for each group
-    group_names = [
-        'Health insurance',
-        'Dental & vision',
-        'Retirement plan',
-        'Paid time off',
-        'Parental leave',
-        'Performance bonuses/equity',
-        'Flexible schedule',
-        'Remote/hybrid work',
-        'Wellness programs',
-        'Education & development'
-    ]
-    
-    result = []
+    grouped = []
+    ungrouped = []
     used_groups = set()
     
-    # First pass - handle grouped items
     for item in items:
-        item_lower = item.lower()
+        matches = _BENEFIT_KEYWORD_GROUPS.get(item)
+        if matches is None:
+            matches = _matching_groups(item)
         
-        for i, group in enumerate(groups):
-            if i in used_groups:
-                continue
-                
-            if any(term in item_lower for term in group):
-                result.append(group_names[i])
+        if not matches:
+            # Capitalize first letter of each word
+            ungrouped.append(' '.join(word.capitalize() for word in item.split()))
+            continue
+        
+        # Use the first group this item matches that hasn't been used yet
+        for i in matches:
+            if i not in used_groups:
+                grouped.append(BENEFIT_GROUP_NAMES[i])
                 used_groups.add(i)
                 break
     
-    # Second pass - add remaining items that don't belong to any group
-    for item in items:
-        item_lower = item.lower()
-        
-        if not any(any(term in item_lower for term in group) for group in groups):
-            # Capitalize first letter of each word
-            item = ' '.join(word.capitalize() for word in item.split())
-            result.append(item)
-    
-    return result
+    # Grouped items come first, then the remaining items
+    return grouped + ungrouped
 
 def deduplicate_highlights(highlights, max_highlights):
     """
@@ -338,21 +397,24 @@ def deduplicate_highlights(highlights, max_highlights):
     # Remove exact duplicates
     seen = set()
     unique_highlights = []
+    lowered = []
     
     for highlight in highlights:
-        if highlight.lower() not in seen:
-            seen.add(highlight.lower())
+        highlight_lower = highlight.lower()
+        if highlight_lower not in seen:
+            seen.add(highlight_lower)
             unique_highlights.append(highlight)
+            lowered.append(highlight_lower)
     
-    # Check for similar highlights and remove less informative ones
-    filtered_highlights = []
-    for highlight in unique_highlights:
+    # Check for similar highlights and remove less informative ones.
+    # Longest first, so a highlight only needs checking against the longer
+    # ones already kept (containment is transitive)
+    kept = []
+    for i in sorted(range(len(unique_highlights)), key=lambda i: -len(lowered[i])):
         # Skip if this highlight is a subset of another one
-        if not any(
-            highlight.lower() in other.lower() and highlight.lower() != other.lower()
-            for other in unique_highlights
-        ):
-            filtered_highlights.append(highlight)
+        if not any(lowered[i] in lowered[j] for j in kept):
+            kept.append(i)
+    filtered_highlights = [unique_highlights[i] for i in sorted(kept)]
     
     # Prioritize section-based highlights
     section_highlights = [h for h in filtered_highlights if any(
@@ -7,9 +7,13 @@ and keyword recognition.
 import re
 import logging
 from collections import Counter
+from services.cache_manager import CacheManager, text_digest
 
 logger = logging.getLogger(__name__)
 
+# Results are deterministic per text, so cache them keyed by a digest of the text
+_skills_cache = CacheManager(max_size=64, ttl=3600)
+
 # Technical skills database with categories
 TECHNICAL_SKILLS = {
     'programming_languages': [
@@ -20,7 +24,7 @@ TECHNICAL_SKILLS = {
     ],
     'frameworks_libraries': [
         'react', 'angular', 'vue', 'django', 'flask', 'spring', 'node.js', 'nodejs', 'express',
-        'laravel', 'symfony', 'rails', 'jquery', 'bootstrap', 'tailwind', 'redux', 'next.js',
+        'laravel', 'symfony', 'rails', 'jquery', 'bootstrap', 'tailwind', 'redux', 'next.js', 'nextjs',
         'gatsby', 'svelte', 'ember', 'backbone', 'nuxt', 'flask', 'fastapi', 'tensorflow',
         'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib', 'seaborn', 
         'opencv', 'spring boot', 'hibernate', '.net', '.net core', 'asp.net', 'xamarin', 
@@ -61,10 +65,8 @@ TECHNICAL_SKILLS = {
     ]
 }
 
-# Flatten the technical skills dictionary for easier searching
-ALL_TECHNICAL_SKILLS = set()
-for category in TECHNICAL_SKILLS.values():
-    ALL_TECHNICAL_SKILLS.update(category)
+# Flatten the technical skills dictionary into a set for membership checks
+ALL_TECHNICAL_SKILLS = frozenset(skill for category in TECHNICAL_SKILLS.values() for skill in category)
 
 # Soft skills to look for
 SOFT_SKILLS = [
@@ -82,6 +84,71 @@ SOFT_SKILLS = [
     'strategic thinking', 'innovation', 'stress management', 'people management'
 ]
 
+# Set of soft skills for membership checks; the list above keeps the match order
+SOFT_SKILLS_SET = frozenset(SOFT_SKILLS)
+
+# Common abbreviations and variations, rewritten to one spelling before matching
+ABBREVIATIONS = {
+    'js': 'javascript',
+    'react.js': 'react',
+    'reactjs': 'react',
+    'vue.js': 'vue',
+    'vuejs': 'vue',
+    'node.js': 'nodejs',
+    'next.js': 'nextjs',
+    'gatsby.js': 'gatsby',
+    'express.js': 'express',
+    'postgresql': 'postgres',
+}
+
+# All abbreviations in one pattern, longest first so 'node.js' wins over 'js'
+ABBREVIATION_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(original) for original in sorted(ABBREVIATIONS, key=len, reverse=True)) + r')\b'
+)
+
+# Common section headers for skills and requirements. Each starts with a literal
+# newline rather than (?:^|\n) so the regex engine can skip ahead to candidate
+# lines; search the text with a newline prepended to match a header on line one
+SKILLS_SECTION_PATTERNS = [
+    re.compile(r'\n(?:technical\s+)?(?:skills|qualifications)(?:\s+required)?(?:\s+and\s+experience)?[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\nrequirements[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:what\s+you\'ll\s+need|what\s+you\s+need|you\s+have)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:required|minimum)\s+(?:skills|qualifications)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:technical\s+requirements|technical\s+skills)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:your\s+skills|your\s+experience)[:\s]*\n', re.IGNORECASE),
+]
+
+# End of a section: a blank line or the next ALL-CAPS heading
+SECTION_END_PATTERN = re.compile(r'\n\s*\n|\n[A-Z][^a-z\n]+:')
+
+# Bullet items (• - * etc.) at the start of a line
+BULLET_PATTERN = re.compile(r'(?:^|\n)[•\-\*]\s*([^\n•\-\*]+)')
+
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Minimal set of skills for "mentions any skill" substring checks: a skill that
+# contains another skill can only occur where the shorter one does, so it adds
+# nothing. Shortest first so any() can stop early
+_SKILL_SUBSTRINGS = tuple(sorted(
+    (
+        skill for skill in ALL_TECHNICAL_SKILLS | SOFT_SKILLS_SET
+        if not any(other != skill and other in skill for other in ALL_TECHNICAL_SKILLS | SOFT_SKILLS_SET)
+    ),
+    key=len
+))
+
+# Runs of word characters, i.e. the spans between \b boundaries
+WORD_RUN_PATTERN = re.compile(r'\w+')
+
+# Whole-word patterns for every known skill, compiled once, technical skills first.
+# Whole words so that e.g. 'css' doesn't match 'access'. Skills made only of word
+# characters get None instead: they match exactly when they are one of the text's
+# word runs, which a set lookup answers without scanning the text again
+_SKILL_PATTERNS = tuple(
+    (skill, None if WORD_RUN_PATTERN.fullmatch(skill) else re.compile(r'\b' + re.escape(skill) + r'\b'))
+    for skill in list(ALL_TECHNICAL_SKILLS) + SOFT_SKILLS
+)
+
 def extract_skills(text):
     """
     Extract skills from job description text.
@@ -94,7 +161,21 @@ def extract_skills(text):
     """
     if not text:
         return []
+    
+    skills = _skills_cache.get_or_compute(text_digest(text), lambda: _extract_skills(text))
+    # Hand out a copy so callers can't modify the cached list
+    return list(skills)
+
+def _extract_skills(text):
+    """
+    Extract skills from job description text without caching.
+    
+    Args:
+        text (str): Job description text
         
+    Returns:
+        list: List of extracted skills
+    """
     try:
         # Normalize text for better matching
         normalized_text = normalize_text(text)
@@ -126,22 +207,8 @@ def normalize_text(text):
     # Convert to lowercase
     text = text.lower()
     
-    # Replace common abbreviations and variations
-    replacements = {
-        'js': 'javascript',
-        'react.js': 'react',
-        'reactjs': 'react',
-        'vue.js': 'vue',
-        'vuejs': 'vue',
-        'node.js': 'nodejs',
-        'next.js': 'nextjs',
-        'gatsby.js': 'gatsby',
-        'express.js': 'express',
-        'postgresql': 'postgres',
-    }
-    
-    for original, replacement in replacements.items():
-        text = re.sub(r'\b' + re.escape(original) + r'\b', replacement, text)
+    # Replace common abbreviations and variations in a single pass
+    text = ABBREVIATION_PATTERN.sub(lambda match: ABBREVIATIONS[match.group(0)], text)
     
     # Keep the original text, just with replacements
     return text
@@ -150,27 +217,20 @@ def extract_from_sections(text):
     """Extract skills from specific sections like 'Skills' or 'Requirements'."""
     skills = []
     
-    # Common section headers
-    section_patterns = [
-        r'(?:^|\n)(?:technical\s+)?(?:skills|qualifications)(?:\s+required)?(?:\s+and\s+experience)?[:\s]*\n',
-        r'(?:^|\n)requirements[:\s]*\n',
-        r'(?:^|\n)(?:what\s+you\'ll\s+need|what\s+you\s+need|you\s+have)[:\s]*\n',
-        r'(?:^|\n)(?:required|minimum)\s+(?:skills|qualifications)[:\s]*\n',
-        r'(?:^|\n)(?:technical\s+requirements|technical\s+skills)[:\s]*\n',
-        r'(?:^|\n)(?:your\s+skills|your\s+experience)[:\s]*\n',
-    ]
+    # Header patterns need a newline before the first line too
+    text = '\n' + text
     
-    for pattern in section_patterns:
-        matches = re.search(pattern, text, re.IGNORECASE)
+    for pattern in SKILLS_SECTION_PATTERNS:
+        matches = pattern.search(text)
         if matches:
             # Get the position right after the header
             start_pos = matches.end()
             
             # Find the end of this section (next section heading or double newline)
-            end_match = re.search(r'\n\s*\n|\n[A-Z][^a-z\n]+:', text[start_pos:])
+            end_match = SECTION_END_PATTERN.search(text, start_pos)
             
             if end_match:
-                section_text = text[start_pos:start_pos + end_match.start()]
+                section_text = text[start_pos:end_match.start()]
             else:
                 # Take next 500 characters if no clear end found
                 section_text = text[start_pos:start_pos + 500]
@@ -179,7 +239,7 @@ def extract_from_sections(text):
             skills_in_section = []
             
             # Look for bullet points first
-            bullet_matches = re.findall(r'(?:^|\n)[•\-\*]\s*([^\n•\-\*]+)', section_text)
+            bullet_matches = BULLET_PATTERN.findall(section_text)
             for bullet in bullet_matches:
                 bullet = bullet.strip()
                 if len(bullet) > 3:  # Skip very short bullets
@@ -187,7 +247,7 @@ def extract_from_sections(text):
             
             # If no bullet points, look for sentence fragments
             if not skills_in_section:
-                sentences = re.split(r'(?<=[.!?])\s+', section_text)
+                sentences = SENTENCE_SPLIT_PATTERN.split(section_text)
                 for sentence in sentences:
                     if 3 < len(sentence) < 150:  # Reasonable size for a skill description
                         skills_in_section.append(sentence.strip())
@@ -201,7 +261,7 @@ def extract_from_bullets(text):
     skills = []
     
     # Look for bullet points followed by text
-    bullet_matches = re.findall(r'(?:^|\n)[•\-\*]\s*([^\n•\-\*]+)', text)
+    bullet_matches = BULLET_PATTERN.findall(text)
     
     for bullet in bullet_matches:
         bullet = bullet.strip()
@@ -211,31 +271,33 @@ def extract_from_bullets(text):
             continue
             
         # Check if bullet contains skill keywords
-        if (
-            any(skill in bullet for skill in ALL_TECHNICAL_SKILLS) or
-            any(skill in bullet for skill in SOFT_SKILLS)
-        ):
+        if any(skill in bullet for skill in _SKILL_SUBSTRINGS):
             skills.append(bullet)
     
     return skills
 
-def extract_from_keywords(text):
-    """Extract skills by looking for direct keyword matches."""
-    skills = []
-    
-    # Technical skills
-    for skill in ALL_TECHNICAL_SKILLS:
-        # Ensure we match whole words only to avoid partial matches
-        # e.g. 'css' shouldn't match 'access'
-        if re.search(r'\b' + re.escape(skill) + r'\b', text):
-            skills.append(skill)
+def _find_known_skills(text):
+    """
+    Find every known skill mentioned in the text as a whole word.
     
-    # Soft skills
-    for skill in SOFT_SKILLS:
-        if re.search(r'\b' + re.escape(skill) + r'\b', text):
-            skills.append(skill)
+    Args:
+        text (str): Normalized (lowercase) text to search
+        
+    Returns:
+        list: Matching technical skills followed by matching soft skills
+    """
+    words = set(WORD_RUN_PATTERN.findall(text))
     
-    return skills
+    # A whole-word match is also a substring match, so the cheap substring
+    # test skips the regex for skills that can't be there
+    return [
+        skill for skill, pattern in _SKILL_PATTERNS
+        if (skill in words if pattern is None else skill in text and pattern.search(text))
+    ]
+
+def extract_from_keywords(text):
+    """Extract skills by looking for direct keyword matches."""
+    return _find_known_skills(text)
 
 def rank_and_clean_skills(skills_list):
     """
@@ -254,21 +316,13 @@ def rank_and_clean_skills(skills_list):
     extracted_skills = []
     for raw_skill in skills_list:
         # Direct matches (simple skills)
-        if raw_skill in ALL_TECHNICAL_SKILLS or raw_skill in SOFT_SKILLS:
+        if raw_skill in ALL_TECHNICAL_SKILLS or raw_skill in SOFT_SKILLS_SET:
             extracted_skills.append(raw_skill)
             continue
             
         # For longer texts, look for known skills within them
-        found = False
-        for skill in ALL_TECHNICAL_SKILLS:
-            if re.search(r'\b' + re.escape(skill) + r'\b', raw_skill):
-                extracted_skills.append(skill)
-                found = True
-                
-        for skill in SOFT_SKILLS:
-            if re.search(r'\b' + re.escape(skill) + r'\b', raw_skill):
-                extracted_skills.append(skill)
-                found = True
+        found = _find_known_skills(raw_skill)
+        extracted_skills.extend(found)
                 
         # If no known skill found, keep the original if it's reasonably short
         if not found and len(raw_skill) < 50:
@@ -279,8 +333,11 @@ def rank_and_clean_skills(skills_list):
     
     # Deduplicate, keeping most frequent skills and ensuring a mix of technical and soft skills
     tech_skills = []
+    seen_tech_skills = set()
     soft_skills = []
+    seen_soft_skills = set()
     other_skills = []
+    seen_other_skills = set()
     
     for skill, count in skill_counter.most_common():
         # Normalize skill name
@@ -292,21 +349,21 @@ def rank_and_clean_skills(skills_list):
             
         # Categorize the skill
         if normalized in ALL_TECHNICAL_SKILLS:
-            if normalized not in [s.lower() for s in tech_skills]:
-                # Format known technical skills properly (e.g., JavaScript not javascript)
-                for category in TECHNICAL_SKILLS.values():
-                    if normalized in category:
-                        idx = category.index(normalized)
-                        tech_skills.append(category[idx])
-                        break
-        elif normalized in SOFT_SKILLS:
-            if normalized not in [s.lower() for s in soft_skills]:
+            if normalized not in seen_tech_skills:
+                seen_tech_skills.add(normalized)
+                tech_skills.append(normalized)
+        elif normalized in SOFT_SKILLS_SET:
+            if normalized not in seen_soft_skills:
                 # Capitalize first letter of soft skills
-                soft_skills.append(normalized.capitalize())
+                soft_skill = normalized.capitalize()
+                seen_soft_skills.add(soft_skill.lower())
+                soft_skills.append(soft_skill)
         else:
-            if normalized not in [s.lower() for s in other_skills]:
+            if normalized not in seen_other_skills:
                 # Capitalize first letter of other skills
-                other_skills.append(normalized.capitalize())
+                other_skill = normalized.capitalize()
+                seen_other_skills.add(other_skill.lower())
+                other_skills.append(other_skill)
     
     # Combine lists, prioritizing technical and soft skills
     result = tech_skills[:15] + soft_skills[:10] + other_skills[:5]
@@ -18,6 +18,9 @@ PRIORITY_KEYWORDS = [
     'position summary', 'job summary', 'about the role'
 ]
 
+# Lowercased once at import so sentence scoring doesn't re-lower every keyword
+_PRIORITY_KEYWORDS_LOWER = tuple(keyword.lower() for keyword in PRIORITY_KEYWORDS)
+
 # Stopwords for filtering
 STOPWORDS = {
     'a', 'an', 'the', 'and', 'or', 'but', 'if', 'because', 'as', 'what',
@@ -31,6 +34,26 @@ STOPWORDS = {
     'who', 'whom', 'this', 'that', 'these', 'those'
 }
 
+# Common summary section headers. Each starts with a literal newline rather than
+# (?:^|\n) so the regex engine can skip ahead to candidate lines; search the text
+# with a newline prepended to match a header on line one
+SUMMARY_PATTERNS = [
+    re.compile(r'\n(?:job\s+summary|position\s+summary|role\s+summary|about\s+the\s+role|about\s+the\s+position|job\s+description)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:overview|summary|introduction)[:\s]*\n', re.IGNORECASE),
+    re.compile(r'\n(?:about\s+the\s+job|about\s+the\s+opportunity)[:\s]*\n', re.IGNORECASE),
+]
+
+# End of a section: a blank line or the next ALL-CAPS heading
+SECTION_END_PATTERN = re.compile(r'\n\s*\n|\n[A-Z][^a-z\n]+:')
+
+# A leading bullet character (• - *), alone or with the whitespace after it
+BULLET_START_PATTERN = re.compile(r'^[•\-\*]')
+LEADING_BULLET_PATTERN = re.compile(r'^[•\-\*]\s*')
+
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?<=[.!?])\s+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+WORD_PATTERN = re.compile(r'\b[a-zA-Z]{3,}\b')
+
 def summarize_job_description(text, max_sentences=3, max_length=300):
     """
     Create a concise summary of a job description.
@@ -68,7 +91,7 @@ def summarize_job_description(text, max_sentences=3, max_length=300):
 def clean_short_text(text):
     """Clean a short text to serve as a summary."""
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
     
     # If the text contains newlines, use only the first paragraph
     paragraphs = text.split('\n\n')
@@ -88,26 +111,21 @@ def extract_intro_or_summary(text):
         str or None: Extracted summary or None if not found
     """
     # Look for common summary section headers
-    summary_patterns = [
-        r'(?:^|\n)(?:job\s+summary|position\s+summary|role\s+summary|about\s+the\s+role|about\s+the\s+position|job\s+description)[:\s]*\n',
-        r'(?:^|\n)(?:overview|summary|introduction)[:\s]*\n',
-        r'(?:^|\n)(?:about\s+the\s+job|about\s+the\s+opportunity)[:\s]*\n',
-    ]
-    
-    for pattern in summary_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    padded_text = '\n' + text
+    for pattern in SUMMARY_PATTERNS:
+        match = pattern.search(padded_text)
         if match:
             # Get text after the header
             start_pos = match.end()
             
             # Find the end of this section (next section heading or double newline)
-            end_match = re.search(r'\n\s*\n|\n[A-Z][^a-z\n]+:', text[start_pos:])
+            end_match = SECTION_END_PATTERN.search(padded_text, start_pos)
             
             if end_match:
-                section_text = text[start_pos:start_pos + end_match.start()]
+                section_text = padded_text[start_pos:end_match.start()]
             else:
                 # Take next 500 characters if no clear end found
-                section_text = text[start_pos:start_pos + 500]
+                section_text = padded_text[start_pos:start_pos + 500]
             
             # Clean up and return the found section
             return clean_and_format_summary(section_text)
@@ -119,7 +137,7 @@ def extract_intro_or_summary(text):
         if (
             len(paragraph) > 50 and 
             not paragraph.isupper() and
-            not re.match(r'^[•\-\*]', paragraph.strip())
+            not BULLET_START_PATTERN.match(paragraph.strip())
         ):
             return clean_and_format_summary(paragraph)
     
@@ -138,10 +156,10 @@ def extract_key_sentences(text, max_sentences=3, max_length=300):
         str: Summary composed of key sentences
     """
     # Split text into sentences
-    sentences = re.split(r'(?<=[.!?])\s+', text)
+    sentences = SENTENCE_SPLIT_PATTERN.split(text)
     
     # Filter out very short sentences, bullets, or ones that look like headings
-    sentences = [s for s in sentences if len(s) > 20 and not s.isupper() and not re.match(r'^[•\-\*]', s.strip())]
+    sentences = [s for s in sentences if len(s) > 20 and not s.isupper() and not BULLET_START_PATTERN.match(s.strip())]
     
     if not sentences:
         return ""
@@ -150,20 +168,17 @@ def extract_key_sentences(text, max_sentences=3, max_length=300):
     scored_sentences = []
     for i, sentence in enumerate(sentences):
         score = score_sentence(sentence, i, len(sentences))
-        scored_sentences.append((score, sentence))
+        scored_sentences.append((score, sentence, i))
     
     # Sort by score (highest first) and take top sentences
     scored_sentences.sort(reverse=True)
-    top_sentences = [s[1] for s in scored_sentences[:max_sentences]]
+    top_sentences = scored_sentences[:max_sentences]
     
     # Sort sentences back in their original order for readability
-    original_order = []
-    for sentence in top_sentences:
-        original_order.append((sentences.index(sentence), sentence))
-    original_order.sort()
+    top_sentences.sort(key=lambda s: s[2])
     
     # Combine sentences and truncate if necessary
-    result = ' '.join([s[1] for s in original_order])
+    result = ' '.join([s[1] for s in top_sentences])
     
     # Truncate if still too long
     if len(result) > max_length:
@@ -200,13 +215,18 @@ def score_sentence(sentence, position, total_sentences):
         length_score = 1.0 - ((length - 150) / 200)
     score += length_score
     
-    # Keyword score
-    keyword_count = sum(1 for keyword in PRIORITY_KEYWORDS if keyword.lower() in sentence_lower)
+    # Keyword score; the score is capped at 3 keywords, so stop counting there
+    keyword_count = 0
+    for keyword in _PRIORITY_KEYWORDS_LOWER:
+        if keyword in sentence_lower:
+            keyword_count += 1
+            if keyword_count == 3:
+                break
     keyword_score = min(1.0, keyword_count / 3)  # Cap at 1.0
     score += keyword_score * 3  # Weight keywords highly
     
     # Informational score (based on word importance)
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', sentence_lower)
+    words = WORD_PATTERN.findall(sentence_lower)
     informational_words = [w for w in words if w not in STOPWORDS]
     
     # More informational words relative to total words is better
@@ -219,8 +239,8 @@ def score_sentence(sentence, position, total_sentences):
 def clean_and_format_summary(text):
     """Clean and format extracted summary text."""
     # Remove excess whitespace, bullet points, etc.
-    text = re.sub(r'\s+', ' ', text).strip()
-    text = re.sub(r'^[•\-\*]\s*', '', text)
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
+    text = LEADING_BULLET_PATTERN.sub('', text)
     
     # Add period at the end if missing
     if text and not text.endswith(('.', '!', '?')):
@@ -6,13 +6,39 @@ Includes fallback processing for when Ollama is unavailable or overloaded.
 """
 import os
 import re
-import json
+import copy
+import time
+import threading
 import logging
+import orjson
 import requests
-from functools import lru_cache
+from requests.adapters import HTTPAdapter
+
+from services.cache_manager import CacheManager, text_digest
+from utils.json_utils import extract_json_block, JsonObjectTracker
 
 logger = logging.getLogger(__name__)
 
+# Job processing prompt; the description goes between the prefix and suffix
+_JOB_PROMPT_PREFIX = (
+    "You are an AI assistant that specializes in analyzing job descriptions. "
+    "Extract the following information from the job description text:\n\n"
+    "1. skills: A list of required technical and soft skills (as an array of strings)\n"
+    "2. summary: A brief 2-3 sentence summary of the job\n"
+    "3. highlights: Top 3-5 most appealing aspects of this job (as an array of strings)\n"
+    "4. notes: Additional important details a job seeker should know\n\n"
+    "Format your response as JSON with these fields. Be concise and factual."
+    "\n\nJOB DESCRIPTION:\n'''\n"
+)
+_JOB_PROMPT_SUFFIX = "\n'''"
+
+# Sections of an unstructured (non-JSON) model response
+SKILLS_SECTION_PATTERN = re.compile(r'(?:skills|requirements):\s*(?:\n|-)+((?:.+(?:\n|$))+)', re.IGNORECASE)
+SUMMARY_SECTION_PATTERN = re.compile(r'(?:summary|overview):\s*([^\n]+(?:\n[^\n]+){0,2})', re.IGNORECASE)
+HIGHLIGHTS_SECTION_PATTERN = re.compile(r'(?:highlights|benefits|perks):\s*(?:\n|-)+((?:.+(?:\n|$))+)', re.IGNORECASE)
+NOTES_SECTION_PATTERN = re.compile(r'(?:notes|additional):\s*([^\n]+(?:\n[^\n]+)*)', re.IGNORECASE)
+BULLET_ITEM_PATTERN = re.compile(r'[-•*]\s*([^-•*\n]+)')
+
 class LLMClient:
     """
     Client for interacting with Ollama LLM.
@@ -23,31 +49,84 @@ class LLMClient:
         self.base_url = os.environ.get('OLLAMA_URL', 'http://localhost:11434')
         self.default_model = os.environ.get('OLLAMA_MODEL', 'llama2')
         self.timeout = int(os.environ.get('OLLAMA_TIMEOUT', 30))
-        self.available = self._check_availability()
         
-        if not self.available:
+        # Results for identical descriptions are reused instead of regenerated
+        self.cache = CacheManager(
+            max_size=int(os.environ.get('CACHE_MAX_SIZE', 1000)),
+            ttl=int(os.environ.get('CACHE_TTL', 3600))
+        )
+        
+        # Reuse keep-alive connections to Ollama across calls
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Availability is re-probed at most once per availability_ttl seconds
+        self.availability_ttl = int(os.environ.get('OLLAMA_HEALTH_INTERVAL', 10))
+        self._availability_lock = threading.Lock()
+        self._available = self._check_availability()
+        self._checked_at = time.monotonic()
+        
+        # The model list is re-fetched at most once per models_ttl seconds
+        self.models_ttl = int(os.environ.get('OLLAMA_MODELS_TTL', 60))
+        self._models = None  # (fetched_at, model names) from the last successful fetch
+        
+        if not self._available:
             logger.warning("Ollama is not available. Using fallback processing.")
     
+    def close(self):
+        """Close the pooled keep-alive connections to Ollama and stop the result cache's cleaner thread."""
+        self.session.close()
+        self.cache.close()
+    
+    @property
+    def available(self):
+        """Whether Ollama is reachable, from a cached probe no older than availability_ttl."""
+        if time.monotonic() - self._checked_at < self.availability_ttl:
+            return self._available
+        
+        with self._availability_lock:
+            # Another thread may have refreshed it while we waited
+            if time.monotonic() - self._checked_at >= self.availability_ttl:
+                self._available = self._check_availability()
+                self._checked_at = time.monotonic()
+            return self._available
+    
+    @available.setter
+    def available(self, value):
+        """Override the cached availability until the next probe, availability_ttl seconds from now."""
+        with self._availability_lock:
+            self._available = value
+            self._checked_at = time.monotonic()
+    
     def _check_availability(self):
         """Check if Ollama is available."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            # HEAD on the root is Ollama's cheapest liveness endpoint
+            response = self.session.head(f"{self.base_url}/", timeout=1)
             return response.status_code == 200
         except requests.RequestException as e:
             logger.warning(f"Ollama is not available: {str(e)}")
             return False
     
-    @lru_cache(maxsize=10)
     def get_available_models(self):
-        """Get list of available models from Ollama."""
+        """Get list of available models from Ollama, cached for models_ttl seconds."""
         if not self.available:
             return []
+        
+        # Failed fetches aren't cached, so an empty list isn't kept once Ollama recovers
+        cached = self._models
+        if cached and time.monotonic() - cached[0] < self.models_ttl:
+            return cached[1]
             
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
-                data = response.json()
-                return [model['name'] for model in data.get('models', [])]
+                data = orjson.loads(response.content)
+                models = [model['name'] for model in data.get('models', [])]
+                self._models = (time.monotonic(), models)
+                return models
             return []
         except requests.RequestException as e:
             logger.error(f"Error getting available models: {str(e)}")
@@ -64,23 +143,9 @@ class LLMClient:
         Returns:
             dict: Processed job data or None if processing failed
         """
-        if not self.available:
-            return None
-            
         # Check if model is available
         model = model or self.default_model
         
-        # Build job processing prompt
-        prompt = (
-            "You are an AI assistant that specializes in analyzing job descriptions. "
-            "Extract the following information from the job description text:\n\n"
-            "1. skills: A list of required technical and soft skills (as an array of strings)\n"
-            "2. summary: A brief 2-3 sentence summary of the job\n"
-            "3. highlights: Top 3-5 most appealing aspects of this job (as an array of strings)\n"
-            "4. notes: Additional important details a job seeker should know\n\n"
-            "Format your response as JSON with these fields. Be concise and factual."
-        )
-        
         # Truncate job description if too long
         max_desc_length = 4000
         if len(job_description) > max_desc_length:
@@ -88,56 +153,114 @@ class LLMClient:
             logger.info(f"Truncated job description from {len(job_description)} to {len(truncated)} characters")
             job_description = truncated
         
+        # Concurrent calls for the same description share one generation;
+        # failures return None and are not cached
+        data = self.cache.get_or_compute(
+            (model, text_digest(job_description)),
+            lambda: self._generate_job_data(job_description, model),
+            timeout=self.timeout
+        )
+        # Hand out a copy so callers can't modify the cached result
+        return copy.deepcopy(data)
+    
+    def _generate_job_data(self, job_description, model):
+        """
+        Process an already truncated job description with Ollama, without caching.
+        
+        Args:
+            job_description (str): Job description text
+            model (str): Model name
+            
+        Returns:
+            dict: Processed job data or None if processing failed
+        """
+        if not self.available:
+            return None
+        
         try:
-            response = requests.post(
+            with self.session.post(
                 f"{self.base_url}/api/generate",
-                json={
+                data=orjson.dumps({
                     "model": model,
-                    "prompt": f"{prompt}\n\nJOB DESCRIPTION:\n'''\n{job_description}\n'''",
-                    "stream": False,
+                    "prompt": _JOB_PROMPT_PREFIX + job_description + _JOB_PROMPT_SUFFIX,
+                    "stream": True,
                     "options": {
                         "temperature": 0.1,  # Lower temperature for more factual outputs
                         "num_predict": 1024,  # Limit token generation
                     }
-                },
-                timeout=self.timeout
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Error from Ollama API: {response.status_code} - {response.text}")
-                return None
+                }),
+                headers={'Content-Type': 'application/json'},
+                timeout=(5, self.timeout),
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"Error from Ollama API: {response.status_code} - {response.text}")
+                    return None
                 
-            result = response.json()
-            generated_text = result.get('response', '')
+                generated_text = self._read_stream(response)
+                if generated_text is None:
+                    return None
             
             # Try to extract JSON from response
             try:
-                # Look for JSON block
-                json_match = re.search(r'```json\s*([\s\S]*?)\s*```|{\s*"[\w]+"\s*:[\s\S]*}', generated_text)
-                if json_match:
-                    json_str = json_match.group(1) or json_match.group(0)
-                    data = json.loads(json_str)
-                    
-                    # Add quality score based on completeness
-                    data['quality_score'] = self._calculate_quality_score(data)
-                    
-                    return data
-                else:
-                    # Try to parse the entire response as JSON
-                    data = json.loads(generated_text)
-                    data['quality_score'] = self._calculate_quality_score(data)
-                    return data
-            except json.JSONDecodeError:
+                # Look for JSON block, otherwise try to parse the entire response as JSON
+                json_str = extract_json_block(generated_text)
+                data = orjson.loads(json_str if json_str else generated_text)
+            except orjson.JSONDecodeError:
                 logger.error("Failed to parse JSON from Ollama response")
                 logger.debug(f"Response was: {generated_text[:500]}...")
                 
                 # Try to extract structured data from unstructured response
                 return self._extract_data_from_text(generated_text)
+            
+            # Add quality score based on completeness
+            data['quality_score'] = self._calculate_quality_score(data)
+            return data
                 
         except requests.RequestException as e:
             logger.error(f"Error communicating with Ollama: {str(e)}")
             return None
     
+    def _read_stream(self, response):
+        """
+        Collect generated text from a streaming Ollama response.
+        
+        Stops as soon as the first JSON object is complete and valid; the
+        parser only uses that object, and closing the stream ends the
+        generation early.
+        
+        Args:
+            response (requests.Response): Streaming /api/generate response
+            
+        Returns:
+            str: Generated text or None if Ollama reported an error
+        """
+        chunks = []
+        tracker = JsonObjectTracker()
+        for line in response.iter_lines():
+            if not line:
+                continue
+            
+            try:
+                chunk = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                logger.error("Received malformed stream chunk from Ollama")
+                return None
+            
+            if 'error' in chunk:
+                logger.error(f"Error from Ollama API: {chunk['error']}")
+                return None
+            
+            piece = chunk.get('response', '')
+            chunks.append(piece)
+            if chunk.get('done'):
+                break
+            # Only check the text when a top-level object has just closed
+            if tracker.feed(piece) and extract_json_block(''.join(chunks)):
+                break
+        
+        return ''.join(chunks)
+    
     def _calculate_quality_score(self, data):
         """
         Calculate quality score for LLM output based on completeness.
@@ -151,24 +274,24 @@ class LLMClient:
         score = 0.0
         
         # Check for skills
-        if 'skills' in data and isinstance(data['skills'], list) and len(data['skills']) > 0:
-            skill_score = min(1.0, len(data['skills']) / 5)  # At least 5 skills for full score
-            score += 0.3 * skill_score
+        skills = data.get('skills')
+        if isinstance(skills, list) and skills:
+            score += 0.3 * min(1.0, len(skills) / 5)  # At least 5 skills for full score
         
         # Check for summary
-        if 'summary' in data and isinstance(data['summary'], str) and len(data['summary']) > 10:
-            summary_score = min(1.0, len(data['summary']) / 100)  # At least 100 chars for full score
-            score += 0.3 * summary_score
+        summary = data.get('summary')
+        if isinstance(summary, str) and len(summary) > 10:
+            score += 0.3 * min(1.0, len(summary) / 100)  # At least 100 chars for full score
         
         # Check for highlights
-        if 'highlights' in data and isinstance(data['highlights'], list) and len(data['highlights']) > 0:
-            highlight_score = min(1.0, len(data['highlights']) / 3)  # At least 3 highlights for full score
-            score += 0.3 * highlight_score
+        highlights = data.get('highlights')
+        if isinstance(highlights, list) and highlights:
+            score += 0.3 * min(1.0, len(highlights) / 3)  # At least 3 highlights for full score
         
         # Check for notes
-        if 'notes' in data and isinstance(data['notes'], str) and len(data['notes']) > 0:
-            note_score = min(1.0, len(data['notes']) / 50)  # At least 50 chars for full score
-            score += 0.1 * note_score
+        notes = data.get('notes')
+        if isinstance(notes, str) and notes:
+            score += 0.1 * min(1.0, len(notes) / 50)  # At least 50 chars for full score
         
         return score
     
@@ -191,31 +314,31 @@ class LLMClient:
         }
         
         # Look for skills section
-        skills_match = re.search(r'(?:skills|requirements):\s*(?:\n|-)+((?:.+(?:\n|$))+)', text, re.IGNORECASE)
+        skills_match = SKILLS_SECTION_PATTERN.search(text)
         if skills_match:
             # Extract skills from bullet points or comma-separated list
             skills_text = skills_match.group(1)
-            skills = re.findall(r'[-•*]\s*([^-•*\n]+)', skills_text)
+            skills = BULLET_ITEM_PATTERN.findall(skills_text)
             if not skills:
-                skills = [s.strip() for s in skills_text.split(',')]
-            result['skills'] = [s.strip() for s in skills if s.strip()]
+                skills = skills_text.split(',')
+            result['skills'] = list(filter(None, map(str.strip, skills)))
         
         # Look for summary section
-        summary_match = re.search(r'(?:summary|overview):\s*([^\n]+(?:\n[^\n]+){0,2})', text, re.IGNORECASE)
+        summary_match = SUMMARY_SECTION_PATTERN.search(text)
         if summary_match:
             result['summary'] = summary_match.group(1).strip()
         
         # Look for highlights section
-        highlights_match = re.search(r'(?:highlights|benefits|perks):\s*(?:\n|-)+((?:.+(?:\n|$))+)', text, re.IGNORECASE)
+        highlights_match = HIGHLIGHTS_SECTION_PATTERN.search(text)
         if highlights_match:
             highlights_text = highlights_match.group(1)
-            highlights = re.findall(r'[-•*]\s*([^-•*\n]+)', highlights_text)
+            highlights = BULLET_ITEM_PATTERN.findall(highlights_text)
             if not highlights:
-                highlights = [h.strip() for h in highlights_text.split('\n')]
-            result['highlights'] = [h.strip() for h in highlights if h.strip()]
+                highlights = highlights_text.split('\n')
+            result['highlights'] = list(filter(None, map(str.strip, highlights)))
         
         # Look for notes section
-        notes_match = re.search(r'(?:notes|additional):\s*([^\n]+(?:\n[^\n]+)*)', text, re.IGNORECASE)
+        notes_match = NOTES_SECTION_PATTERN.search(text)
         if notes_match:
             result['notes'] = notes_match.group(1).strip()
         
@@ -0,0 +1,148 @@
+"""
+Tests for services.cache_manager.
+"""
+import threading
+import time
+import unittest
+from unittest import mock
+
+from services.cache_manager import CacheManager
+
+
+class GetOrComputeTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache = CacheManager(max_size=10, ttl=0)
+        self.started = threading.Event()
+        self.release = threading.Event()
+    
+    def blocking_producer(self, value):
+        """Producer that signals it started, then waits to be released."""
+        def producer():
+            self.started.set()
+            self.release.wait(5)
+            return value
+        return producer
+    
+    def start(self, target, results, key='k', **kwargs):
+        """Run get_or_compute on a thread, appending its result to results."""
+        thread = threading.Thread(
+            target=lambda: results.append(self.cache.get_or_compute(key, target, **kwargs))
+        )
+        thread.start()
+        return thread
+    
+    def test_waiters_block_until_owner_finishes(self):
+        owner_results, waiter_results = [], []
+        waiter_calls = []
+        owner = self.start(self.blocking_producer('value'), owner_results)
+        self.assertTrue(self.started.wait(5))
+        
+        waiters = [self.start(lambda: waiter_calls.append(1) or 'other', waiter_results) for _ in range(3)]
+        for waiter in waiters:
+            waiter.join(0.05)
+            self.assertTrue(waiter.is_alive())
+        
+        self.release.set()
+        for thread in [owner] + waiters:
+            thread.join(5)
+        
+        self.assertEqual(owner_results, ['value'])
+        self.assertEqual(waiter_results, ['value'] * 3)
+        self.assertEqual(waiter_calls, [])
+        self.assertEqual(self.cache.get('k'), 'value')
+    
+    def test_none_result_is_not_cached(self):
+        calls = []
+        producer = lambda: calls.append(1)
+        
+        self.assertIsNone(self.cache.get_or_compute('k', producer))
+        self.assertIsNone(self.cache.get_or_compute('k', producer))
+        
+        self.assertEqual(len(calls), 2)
+        self.assertNotIn('k', self.cache.cache)
+    
+    def test_waiter_recomputes_after_timeout(self):
+        owner_results, waiter_results = [], []
+        owner = self.start(self.blocking_producer('slow'), owner_results)
+        self.assertTrue(self.started.wait(5))
+        
+        waiter = self.start(lambda: 'own', waiter_results, timeout=0.05)
+        waiter.join(5)
+        self.assertEqual(waiter_results, ['own'])
+        self.assertTrue(owner.is_alive())
+        
+        self.release.set()
+        owner.join(5)
+        self.assertEqual(owner_results, ['slow'])
+    
+    def test_waiter_recomputes_after_owner_produces_none(self):
+        owner_results, waiter_results = [], []
+        owner = self.start(self.blocking_producer(None), owner_results)
+        self.assertTrue(self.started.wait(5))
+        
+        waiter = self.start(lambda: 'own', waiter_results)
+        waiter.join(0.05)
+        self.assertTrue(waiter.is_alive())
+        
+        self.release.set()
+        owner.join(5)
+        waiter.join(5)
+        self.assertEqual(owner_results, [None])
+        self.assertEqual(waiter_results, ['own'])
+    
+    def test_inflight_key_removed_when_producer_raises(self):
+        def failing():
+            raise ValueError('boom')
+        
+        with self.assertRaises(ValueError):
+            self.cache.get_or_compute('k', failing)
+        self.assertNotIn('k', self.cache._inflight)
+        
+        # The next caller computes normally instead of waiting on a dead owner
+        self.assertEqual(self.cache.get_or_compute('k', lambda: 'value', timeout=5), 'value')
+        self.assertNotIn('k', self.cache._inflight)
+
+
+class ExpiryTest(unittest.TestCase):
+    
+    def test_cleaner_removes_only_expired_items(self):
+        now = [1000.0]
+        with mock.patch('services.cache_manager.time.time', lambda: now[0]):
+            cache = CacheManager(max_size=10, ttl=0.2)
+            try:
+                cache.set('old', 1)
+                cache.set('rewritten', 2)
+                now[0] += 0.15
+                # Leaves a stale heap entry for 'rewritten' that must not evict it
+                cache.set('rewritten', 3)
+                cache.set('fresh', 4)
+                now[0] += 0.1
+                
+                deadline = time.monotonic() + 5
+                while 'old' in cache.cache and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                
+                self.assertNotIn('old', cache.cache)
+                self.assertEqual(cache.get('rewritten'), 3)
+                self.assertEqual(cache.get('fresh'), 4)
+            finally:
+                cache.close()
+    
+    def test_close_stops_cleaner(self):
+        cache = CacheManager(max_size=10, ttl=3600)
+        cache.set('k', 'value')
+        self.assertTrue(cache.cleaner.is_alive())
+        
+        cache.close()
+        
+        self.assertFalse(cache.cleaner.is_alive())
+        self.assertEqual(cache.get('k'), 'value')
+    
+    def test_close_without_cleaner(self):
+        cache = CacheManager(max_size=10, ttl=0)
+        self.assertIsNone(cache.cleaner)
+        cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests for utils.html_utils.
+"""
+import unittest
+
+import orjson
+
+from utils.html_utils import extract_metadata_fields
+
+def _page(json_ld=None, head=''):
+    """Build an HTML page with optional JSON-LD and extra head markup."""
+    script = ''
+    if json_ld is not None:
+        script = '<script type="application/ld+json">' + orjson.dumps(json_ld).decode('utf-8') + '</script>'
+    return '<html><head><title>Page title</title>' + head + script + '</head><body><p>Body</p></body></html>'
+
+
+class JsonLdMetadataTest(unittest.TestCase):
+    
+    POSTING = {
+        '@context': 'https://schema.org',
+        '@type': 'JobPosting',
+        'title': 'Backend Engineer',
+        'hiringOrganization': {'@type': 'Organization', 'name': 'Acme'},
+        'jobLocation': {'@type': 'Place', 'address': {'addressLocality': 'Berlin'}},
+        'description': '<p>Build <b>APIs</b>.</p>',
+    }
+    
+    EXPECTED = {
+        'title': 'Backend Engineer',
+        'company': 'Acme',
+        'location': 'Berlin',
+        'description': 'Build APIs .',
+    }
+    
+    def test_top_level_object(self):
+        self.assertEqual(extract_metadata_fields(_page(self.POSTING)), self.EXPECTED)
+    
+    def test_graph_member(self):
+        json_ld = {'@context': 'https://schema.org', '@graph': [{'@type': 'WebPage'}, self.POSTING]}
+        self.assertEqual(extract_metadata_fields(_page(json_ld)), self.EXPECTED)
+    
+    def test_list_typed_type(self):
+        posting = dict(self.POSTING, **{'@type': ['JobPosting', 'Thing']})
+        self.assertEqual(extract_metadata_fields(_page(posting)), self.EXPECTED)
+    
+    def test_entity_escaped_values(self):
+        posting = dict(
+            self.POSTING,
+            title='Data &amp; ML Engineer',
+            description='&lt;p&gt;Build &amp;amp; ship&lt;/p&gt;'
+        )
+        metadata = extract_metadata_fields(_page(posting, '<meta property="og:title" content="Data and ML">'))
+        self.assertEqual(metadata['title'], 'Data & ML Engineer')
+        self.assertEqual(metadata['description'], 'Build & ship')
+    
+    def test_falls_back_to_meta_tags(self):
+        head = (
+            '<meta property="og:title" content="OG title">'
+            '<meta property="og:site_name" content="Site">'
+            '<meta name="geo.placename" content="Paris">'
+            '<meta name="description" content="Meta description">'
+        )
+        self.assertEqual(extract_metadata_fields(_page(head=head)), {
+            'title': 'OG title',
+            'company': 'Site',
+            'location': 'Paris',
+            'description': 'Meta description',
+        })
+        
+        # A posting without a field leaves it to the meta tags
+        posting = {'@type': 'JobPosting', 'title': 'Backend Engineer'}
+        self.assertEqual(extract_metadata_fields(_page(posting, head)), {
+            'title': 'Backend Engineer',
+            'company': 'Site',
+            'location': 'Paris',
+            'description': 'Meta description',
+        })
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Tests for utils.json_utils.
+"""
+import unittest
+
+from utils.json_utils import extract_json_block, JsonObjectTracker
+
+class ExtractJsonBlockTest(unittest.TestCase):
+    
+    def test_object_in_markdown_fence(self):
+        text = 'Sure:\n```json\n{"company": "A", "salary": {"min": 0}}\n```\nDone.'
+        self.assertEqual(extract_json_block(text), '{"company": "A", "salary": {"min": 0}}')
+    
+    def test_braces_inside_strings(self):
+        text = '{"notes": "use {braces} and \\"quotes\\""}'
+        self.assertEqual(extract_json_block(text), text)
+    
+    def test_skips_brace_in_prose(self):
+        text = 'Here is the {requested} output:\n```json\n{"company": "A"}\n```'
+        self.assertEqual(extract_json_block(text), '{"company": "A"}')
+    
+    def test_skips_unclosed_brace_in_prose(self):
+        text = 'Fields use { as a marker. {"company": "A"}'
+        self.assertEqual(extract_json_block(text), '{"company": "A"}')
+    
+    def test_no_valid_object(self):
+        self.assertIsNone(extract_json_block('no json here'))
+        self.assertIsNone(extract_json_block('{"company": "A"'))
+        self.assertIsNone(extract_json_block('{requested}'))
+
+
+class JsonObjectTrackerTest(unittest.TestCase):
+    
+    def feed_all(self, pieces):
+        tracker = JsonObjectTracker()
+        return [tracker.feed(piece) for piece in pieces]
+    
+    def test_reports_close_of_top_level_object(self):
+        self.assertEqual(self.feed_all(['{"a": {"b"', ': 1}', ', "c": 2', '}', ' done']), [False, False, False, True, False])
+    
+    def test_ignores_braces_in_strings(self):
+        self.assertEqual(self.feed_all(['{"notes": "}', ' \\"}', '"}']), [False, False, True])
+    
+    def test_prose_braces_close_without_hiding_later_object(self):
+        pieces = ['Here is the {requested}', ' "output": ', '{"company"', ': "A"}']
+        self.assertEqual(self.feed_all(pieces), [True, False, False, True])
+        self.assertEqual(extract_json_block(''.join(pieces[:2])), None)
+        self.assertEqual(extract_json_block(''.join(pieces)), '{"company": "A"}')
+
+if __name__ == '__main__':
+    unittest.main()
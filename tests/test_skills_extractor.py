@@ -0,0 +1,27 @@
+"""
+Tests for services.extractors.skills_extractor.
+"""
+import unittest
+
+from services.extractors.skills_extractor import (
+    ABBREVIATIONS, ALL_TECHNICAL_SKILLS, extract_skills, normalize_text
+)
+
+class AbbreviationTest(unittest.TestCase):
+    
+    def test_every_abbreviation_maps_to_a_known_skill(self):
+        for original, replacement in ABBREVIATIONS.items():
+            with self.subTest(original=original):
+                self.assertIn(replacement, ALL_TECHNICAL_SKILLS)
+    
+    def test_longest_abbreviation_wins(self):
+        self.assertEqual(normalize_text('Next.js, Node.js and JS'), 'nextjs, nodejs and javascript')
+    
+    def test_rewritten_frameworks_are_extracted(self):
+        skills = extract_skills('We build apps with Next.js and Node.js, React.js and Vue.js.')
+        for skill in ('nextjs', 'nodejs', 'react', 'vue'):
+            with self.subTest(skill=skill):
+                self.assertIn(skill, skills)
+
+if __name__ == '__main__':
+    unittest.main()
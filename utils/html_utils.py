@@ -1,12 +1,61 @@
 """
 HTML processing utilities for job data extraction.
 """
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import html
 import logging
 import re
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# lxml's C parser builds the tree noticeably faster than Python's html.parser;
+# fall back to the built-in one where lxml isn't installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Runs of blank (or whitespace-only) lines, collapsed to one blank line
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+# The only tags job URL lookups read; metadata lookups also read JSON-LD scripts
+HEAD_TAG_NAMES = ['title', 'meta', 'link', 'base']
+METADATA_TAG_NAMES = HEAD_TAG_NAMES + ['script']
+
+# Script type carrying Schema.org structured data
+JSON_LD_TYPE = 'application/ld+json'
+
+# URL lookups only read attributes, so a URL-only parse can skip building every other tag.
+# Metadata needs a full parse: a title's text depends on the tags around it
+URL_TAGS_ONLY = SoupStrainer(HEAD_TAG_NAMES)
+
+def parse_html_once(html_content):
+    """
+    Parse HTML a single time and extract metadata, clean text and job URL.
+    
+    Args:
+        html_content (str): HTML content from job posting
+        
+    Returns:
+        tuple: (metadata dict, clean text, job URL)
+    """
+    try:
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+    except Exception as e:
+        logger.error(f"Error parsing HTML: {str(e)}")
+        return _empty_metadata(), html_content, ""
+    
+    # Text extraction strips script/style tags, so it runs last; metadata and URL
+    # lookups share one walk of the tree
+    head_tags = soup.find_all(METADATA_TAG_NAMES)
+    metadata = _metadata_from_tags(head_tags)
+    job_url = _job_url_from_tags(head_tags)
+    text = _text_from_soup(soup, html_content)
+    
+    return metadata, text, job_url
+
 def extract_text_from_html(html_content):
     """
     Extract clean text from HTML content.
@@ -18,8 +67,25 @@ def extract_text_from_html(html_content):
         str: Clean text with preserved structure
     """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+    except Exception as e:
+        logger.error(f"Error extracting text from HTML: {str(e)}")
+        return html_content  # Return original content if parsing fails
+    
+    return _text_from_soup(soup, html_content)
+
+def _text_from_soup(soup, html_content):
+    """
+    Extract clean text from a parsed document. Removes script and style tags from soup.
+    
+    Args:
+        soup (BeautifulSoup): Parsed HTML document
+        html_content (str): Original HTML, returned if extraction fails
         
+    Returns:
+        str: Clean text with preserved structure
+    """
+    try:
         # Remove script and style elements
         for script in soup(["script", "style"]):
             script.extract()
@@ -35,7 +101,7 @@ def extract_text_from_html(html_content):
         text = '\n'.join(chunk for chunk in chunks if chunk)
         
         # Clean up excessive whitespace
-        text = re.sub(r'\n\s*\n', '\n\n', text)
+        text = BLANK_LINES_PATTERN.sub('\n\n', text)
         
         return text
     except Exception as e:
@@ -53,25 +119,72 @@ def extract_job_url(html_content):
         str: URL of the job posting
     """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=URL_TAGS_ONLY)
+    except Exception as e:
+        logger.error(f"Error extracting URL from HTML: {str(e)}")
+        return ""
+    
+    return _job_url_from_tags(soup.find_all(HEAD_TAG_NAMES))
+
+def _find_tag(tags, name, attr=None, value=None):
+    """
+    Find the first tag with a given name and attribute value, matching like soup.find.
+    
+    Args:
+        tags (list): Tags in document order
+        name (str): Tag name
+        attr (str): Attribute to match, or None to match on the name only
+        value (str or bool): Attribute value, or True for any tag that has the attribute
+        
+    Returns:
+        Tag: First matching tag or None
+    """
+    for tag in tags:
+        if tag.name != name:
+            continue
+        if attr is None:
+            return tag
         
+        actual = tag.get(attr)
+        if value is True:
+            if actual is not None:
+                return tag
+        elif isinstance(actual, list):
+            # Multi-valued attributes such as rel match any one value or the whole value
+            if value in actual or ' '.join(actual) == value:
+                return tag
+        elif actual == value:
+            return tag
+    return None
+
+def _job_url_from_tags(tags):
+    """
+    Extract job posting URL from a document's title, meta, link and base tags.
+    
+    Args:
+        tags (list): Tags including those named in HEAD_TAG_NAMES, in document order
+        
+    Returns:
+        str: URL of the job posting
+    """
+    try:
         # Look for canonical URL
-        canonical = soup.find('link', rel='canonical')
+        canonical = _find_tag(tags, 'link', 'rel', 'canonical')
         if canonical and canonical.get('href'):
             return canonical.get('href')
         
         # Look for og:url meta tag
-        og_url = soup.find('meta', property='og:url')
+        og_url = _find_tag(tags, 'meta', 'property', 'og:url')
         if og_url and og_url.get('content'):
             return og_url.get('content')
         
         # Look for any other URL in meta tags
-        meta_url = soup.find('meta', {'name': 'url'})
+        meta_url = _find_tag(tags, 'meta', 'name', 'url')
         if meta_url and meta_url.get('content'):
             return meta_url.get('content')
         
         # Try to find the current page URL
-        base_url = soup.find('base', href=True)
+        base_url = _find_tag(tags, 'base', 'href', True)
         if base_url and base_url.get('href'):
             return base_url.get('href')
         
@@ -80,9 +193,18 @@ def extract_job_url(html_content):
         logger.error(f"Error extracting URL from HTML: {str(e)}")
         return ""
 
+def _empty_metadata():
+    """Metadata dict with every field unset."""
+    return {
+        "title": "",
+        "company": "",
+        "location": "",
+        "description": ""
+    }
+
 def extract_metadata_fields(html_content):
     """
-    Extract job-related metadata from HTML meta tags.
+    Extract job-related metadata from HTML JSON-LD and meta tags.
     
     Args:
         html_content (str): HTML content
@@ -90,41 +212,153 @@ def extract_metadata_fields(html_content):
     Returns:
         dict: Dictionary of metadata values
     """
-    metadata = {
-        "title": "",
-        "company": "",
-        "location": "",
-        "description": ""
-    }
+    try:
+        soup = BeautifulSoup(html_content, HTML_PARSER)
+    except Exception as e:
+        logger.error(f"Error extracting metadata from HTML: {str(e)}")
+        return _empty_metadata()
+    
+    return _metadata_from_tags(soup.find_all(METADATA_TAG_NAMES))
+
+def _json_ld_objects(data):
+    """
+    Yield the objects in decoded JSON-LD: top-level objects and their @graph members.
+    
+    Args:
+        data: Decoded JSON-LD value
+        
+    Yields:
+        dict: JSON-LD objects
+    """
+    for item in (data if isinstance(data, list) else [data]):
+        if isinstance(item, dict):
+            yield item
+            graph = item.get('@graph')
+            if isinstance(graph, list):
+                yield from (node for node in graph if isinstance(node, dict))
+
+def _find_job_posting(tags):
+    """
+    Find the first Schema.org JobPosting in a document's JSON-LD scripts.
+    
+    Args:
+        tags (list): Tags named in METADATA_TAG_NAMES, in document order
+        
+    Returns:
+        dict: JobPosting object or None if there is none
+    """
+    for tag in tags:
+        if tag.name != 'script' or (tag.get('type') or '').strip().lower() != JSON_LD_TYPE:
+            continue
+        
+        try:
+            # orjson rejects str subclasses such as BeautifulSoup's script strings
+            data = orjson.loads(str(tag.string or ''))
+        except orjson.JSONDecodeError:
+            continue
+        
+        for item in _json_ld_objects(data):
+            item_type = item.get('@type')
+            if item_type == 'JobPosting' or (isinstance(item_type, list) and 'JobPosting' in item_type):
+                return item
+    return None
+
+def _json_ld_text(value, key=None):
+    """
+    Read a text value from JSON-LD, which may be a string or an object (or list of them).
+    
+    Many job boards entity-escape JSON-LD strings (e.g. "Data &amp; ML"),
+    so entities are decoded here.
+    
+    Args:
+        value: JSON-LD value
+        key (str): Property to read when the value is an object
+        
+    Returns:
+        str: Unescaped, stripped text, or an empty string if there is none
+    """
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if key and isinstance(value, dict):
+        value = value.get(key)
+    return html.unescape(value).strip() if isinstance(value, str) else ""
+
+def _metadata_from_job_posting(posting):
+    """
+    Extract job-related metadata from a Schema.org JobPosting.
+    
+    Args:
+        posting (dict): JobPosting object from JSON-LD
+        
+    Returns:
+        dict: Dictionary of metadata values, empty where the posting has none
+    """
+    metadata = _empty_metadata()
+    metadata["title"] = _json_ld_text(posting.get('title'))
+    metadata["company"] = _json_ld_text(posting.get('hiringOrganization'), 'name')
+    
+    location = posting.get('jobLocation')
+    if isinstance(location, list):
+        location = location[0] if location else None
+    if isinstance(location, dict):
+        location = location.get('address')
+    metadata["location"] = _json_ld_text(location, 'addressLocality')
+    
+    # Descriptions are usually HTML (escaped or not); flatten them to one line like a meta description
+    description = _json_ld_text(posting.get('description'))
+    if '<' in description:
+        description = ' '.join(BeautifulSoup(description, HTML_PARSER).get_text(' ').split())
+    metadata["description"] = description
+    
+    return metadata
+
+def _metadata_from_tags(tags):
+    """
+    Extract job-related metadata from a document's JSON-LD, title and meta tags.
+    
+    Args:
+        tags (list): Tags named in METADATA_TAG_NAMES, in document order
+        
+    Returns:
+        dict: Dictionary of metadata values
+    """
+    metadata = _empty_metadata()
     
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # A JobPosting in JSON-LD is the most complete source; meta tags fill the gaps
+        posting = _find_job_posting(tags)
+        if posting:
+            metadata.update(_metadata_from_job_posting(posting))
         
         # Extract title
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            metadata["title"] = og_title.get('content')
-        else:
-            title_tag = soup.find('title')
-            if title_tag:
-                metadata["title"] = title_tag.text
+        if not metadata["title"]:
+            og_title = _find_tag(tags, 'meta', 'property', 'og:title')
+            if og_title and og_title.get('content'):
+                metadata["title"] = og_title.get('content')
+            else:
+                title_tag = _find_tag(tags, 'title')
+                if title_tag:
+                    metadata["title"] = title_tag.text
         
         # Extract company
-        company_meta = soup.find('meta', {'name': 'company'}) or soup.find('meta', {'property': 'og:site_name'})
-        if company_meta and company_meta.get('content'):
-            metadata["company"] = company_meta.get('content')
+        if not metadata["company"]:
+            company_meta = _find_tag(tags, 'meta', 'name', 'company') or _find_tag(tags, 'meta', 'property', 'og:site_name')
+            if company_meta and company_meta.get('content'):
+                metadata["company"] = company_meta.get('content')
         
         # Extract location
-        location_meta = soup.find('meta', {'name': 'location'}) or soup.find('meta', {'name': 'geo.placename'})
-        if location_meta and location_meta.get('content'):
-            metadata["location"] = location_meta.get('content')
+        if not metadata["location"]:
+            location_meta = _find_tag(tags, 'meta', 'name', 'location') or _find_tag(tags, 'meta', 'name', 'geo.placename')
+            if location_meta and location_meta.get('content'):
+                metadata["location"] = location_meta.get('content')
         
         # Extract description
-        description_meta = soup.find('meta', {'name': 'description'}) or soup.find('meta', {'property': 'og:description'})
-        if description_meta and description_meta.get('content'):
-            metadata["description"] = description_meta.get('content')
+        if not metadata["description"]:
+            description_meta = _find_tag(tags, 'meta', 'name', 'description') or _find_tag(tags, 'meta', 'property', 'og:description')
+            if description_meta and description_meta.get('content'):
+                metadata["description"] = description_meta.get('content')
         
         return metadata
     except Exception as e:
         logger.error(f"Error extracting metadata from HTML: {str(e)}")
-        return metadata
\ No newline at end of file
+        return metadata
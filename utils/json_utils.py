@@ -0,0 +1,116 @@
+"""
+JSON helpers for parsing LLM output.
+"""
+import orjson
+
+def extract_json_block(text):
+    """
+    Find the first balanced JSON object in a block of text that parses.
+    
+    Scans forward from each opening brace, tracking string literals and
+    escapes, so markdown fences or trailing commentary around the object
+    are ignored without any regex backtracking. Braces in surrounding prose
+    (e.g. "the {requested} output") don't hide a later object: a candidate
+    that is unbalanced or isn't valid JSON is skipped and the scan resumes
+    at the next opening brace.
+    
+    Args:
+        text (str): Generated text that may contain a JSON object
+        
+    Returns:
+        str or None: The JSON object text, or None if no valid object is found
+    """
+    start = text.find('{')
+    while start != -1:
+        end = _find_closing_brace(text, start)
+        if end != -1:
+            candidate = text[start:end + 1]
+            try:
+                orjson.loads(candidate)
+                return candidate
+            except orjson.JSONDecodeError:
+                pass
+        start = text.find('{', start + 1)
+    
+    return None
+
+def _find_closing_brace(text, start):
+    """
+    Find the brace closing the object that opens at text[start].
+    
+    Args:
+        text (str): Text to scan
+        start (int): Index of an opening brace
+        
+    Returns:
+        int: Index of the matching closing brace, or -1 if the object never closes
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    for i in range(start, len(text)):
+        char = text[i]
+        
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+    
+    return -1
+
+class JsonObjectTracker:
+    """
+    Follow JSON brace depth across streamed chunks of generated text.
+    
+    Lets a stream reader look for a complete object only when a top-level
+    brace has just closed, instead of rescanning everything received so far
+    whenever a chunk contains a '}'.
+    """
+    
+    def __init__(self):
+        """Start outside any object."""
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, piece):
+        """
+        Advance over the next chunk of text.
+        
+        Args:
+            piece (str): Next chunk of generated text
+            
+        Returns:
+            bool: True if a top-level object closed within the chunk
+        """
+        closed = False
+        for char in piece:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                # Quotes in prose outside an object don't start a string
+                self.in_string = self.depth > 0
+            elif char == '{':
+                self.depth += 1
+            elif char == '}' and self.depth:
+                self.depth -= 1
+                if self.depth == 0:
+                    closed = True
+        return closed
@@ -6,6 +6,72 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def _search_in_priority_order(scan_pattern, patterns, text):
+    """
+    Find the first pattern, in list order, that matches anywhere in the text.
+    
+    scan_pattern is an alternation of all the patterns where capture group i + 1 is
+    patterns[i]. One scan finds the earliest match of any of them; patterns listed
+    before that one cannot match at or before it, so only they are searched again,
+    from just past it.
+    
+    Args:
+        scan_pattern (re.Pattern): Combined alternation of the patterns
+        patterns (list): Compiled patterns in priority order
+        text (str): Text to search
+        
+    Returns:
+        tuple: (index of the pattern, its first match), or (-1, None) if none match
+    """
+    first = scan_pattern.search(text)
+    if not first:
+        return -1, None
+    
+    branch = first.lastindex - 1
+    for index, pattern in enumerate(patterns[:branch]):
+        match = pattern.search(text, first.start() + 1)
+        if match:
+            return index, match
+    
+    return branch, patterns[branch].match(text, first.start())
+
+# Common patterns for job titles. Patterns that open with a repeated class
+# only start where a run of that class starts: a match from inside the run
+# implies one from its start, so this avoids rescanning the run from every
+# position (quadratic or worse on long runs)
+_TITLE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:job title|position|role|job)[\s:]+([A-Za-z0-9\s\-\&\/\(\)\,\.]+)(?:\n|\.|,)',
+    r'hiring(?:[\s:]+)(?:a|an)?(?:[\s:]+)([A-Za-z0-9\s\-\&\/\(\)]+)(?:\n|\.|,)',
+    r'(?<![A-Za-z0-9\s\-\&\/\(\)])([A-Za-z0-9\s\-\&\/\(\)]+)\s(?:position|job|role)(?:\s+)'
+)]
+
+# Leading article or preposition captured in front of a title
+_TITLE_PREFIX_PATTERN = re.compile(r'^\s*(?:for|the|a|an)\s+', re.IGNORECASE)
+
+# First-line title fallback: lines to skip, and role words a title line should contain
+_TITLE_LINE_EXCLUDE_PATTERN = re.compile(r'(apply|about|company|www|http|location)', re.IGNORECASE)
+_TITLE_LINE_ROLE_PATTERN = re.compile(r'(?:developer|engineer|manager|analyst|designer|specialist|coordinator)\b', re.IGNORECASE)
+
+def _first_lines(text, count):
+    """
+    Yield the first lines of text without splitting the whole text.
+    
+    Args:
+        text (str): Text to scan
+        count (int): Maximum number of lines to yield
+        
+    Yields:
+        str: Lines in order, without their newline characters
+    """
+    start = 0
+    for _ in range(count):
+        end = text.find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
 def extract_job_title(text):
     """
     Extract job title from text.
@@ -16,34 +82,43 @@ def extract_job_title(text):
     Returns:
         str: Extracted job title
     """
-    # Common patterns for job titles
-    patterns = [
-        r'(?:job title|position|role|job)[\s:]+([A-Za-z0-9\s\-\&\/\(\)\,\.]+)(?:\n|\.|,)',
-        r'hiring(?:[\s:]+)(?:a|an)?(?:[\s:]+)([A-Za-z0-9\s\-\&\/\(\)]+)(?:\n|\.|,)',
-        r'([A-Za-z0-9\s\-\&\/\(\)]+)(?:\s+)(?:position|job|role)(?:\s+)'
-    ]
-    
-    for pattern in patterns:
-        matches = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _TITLE_PATTERNS:
+        matches = pattern.search(text)
         if matches:
             title = matches.group(1).strip()
             # Limit title length and clean common noise
             if 3 < len(title) < 100:  # Reasonable title length
                 # Clean common noise
-                title = re.sub(r'^\s*(?:for|the|a|an)\s+', '', title, flags=re.IGNORECASE)
+                title = _TITLE_PREFIX_PATTERN.sub('', title)
                 return title
     
     # Fallback: Look for the first line that might be a title
-    lines = text.split('\n')
-    for line in lines[:5]:  # Check first 5 lines
+    for line in _first_lines(text, 5):  # Check first 5 lines
         line = line.strip()
-        if 10 < len(line) < 100 and not re.search(r'(apply|about|company|www|http|location)', line, re.IGNORECASE):
-            # Match common job title patterns
-            if re.search(r'(?:developer|engineer|manager|analyst|designer|specialist|coordinator)\b', line, re.IGNORECASE):
-                return line
+        # Most lines name no role, so that cheaper rejection runs first
+        if 10 < len(line) < 100 and _TITLE_LINE_ROLE_PATTERN.search(line) and not _TITLE_LINE_EXCLUDE_PATTERN.search(line):
+            return line
     
     return ""
 
+# Common patterns for company names
+_COMPANY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:company|organization|employer)[\s:]+([A-Za-z0-9\s\-\&\.]+)(?:\n|\.|,)',
+    r'(?:at|with|for|by)\s+([A-Za-z0-9\s\-\&\.]+?)(?:\s+is|\s+are|\s+has|\s+have|\n|\.|,)',
+    r'about\s+([A-Za-z0-9\s\-\&\.]+?)(?:\n|\.|,|:)'
+)]
+
+# Common words that get captured along with company and location names
+_FILLER_WORDS_PATTERN = re.compile(r'\b(the|a|an|is|are|we|our|this|that)\b', re.IGNORECASE)
+
+# Legal-form suffixes, each with a pattern capturing the name in front of it
+# (anchored to run starts like _TITLE_PATTERNS)
+_COMPANY_INDICATORS = ['Inc', 'LLC', 'Ltd', 'Limited', 'Corporation', 'Corp', 'GmbH']
+_COMPANY_INDICATOR_PATTERNS = [
+    (indicator, re.compile(r'(?<![A-Za-z0-9\s\-\&\.])([A-Za-z0-9\s\-\&\.]+' + re.escape(indicator) + r')'))
+    for indicator in _COMPANY_INDICATORS
+]
+
 def extract_company(text):
     """
     Extract company name from text.
@@ -54,36 +129,51 @@ def extract_company(text):
     Returns:
         str: Extracted company name
     """
-    # Common patterns for company names
-    patterns = [
-        r'(?:company|organization|employer)[\s:]+([A-Za-z0-9\s\-\&\.]+)(?:\n|\.|,)',
-        r'(?:at|with|for|by)\s+([A-Za-z0-9\s\-\&\.]+?)(?:\s+is|\s+are|\s+has|\s+have|\n|\.|,)',
-        r'about\s+([A-Za-z0-9\s\-\&\.]+?)(?:\n|\.|,|:)'
-    ]
-    
-    for pattern in patterns:
-        matches = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _COMPANY_PATTERNS:
+        matches = pattern.search(text)
         if matches:
             company = matches.group(1).strip()
             # Remove common words that might be captured
-            company = re.sub(r'\b(the|a|an|is|are|we|our|this|that)\b', '', company, flags=re.IGNORECASE).strip()
+            company = _FILLER_WORDS_PATTERN.sub('', company).strip()
             if 3 < len(company) < 50:  # Reasonable company name length
                 return company
     
-    # Try looking for company in the first paragraph
-    first_paragraph = text.split('\n\n')[0] if '\n\n' in text else text.split('\n')[0]
-    company_indicators = ['Inc', 'LLC', 'Ltd', 'Limited', 'Corporation', 'Corp', 'GmbH']
+    # Try looking for company in the first paragraph (or first line if there's only one paragraph)
+    end = text.find('\n\n')
+    if end == -1:
+        end = text.find('\n')
+    first_paragraph = text[:end] if end != -1 else text
     
-    for indicator in company_indicators:
+    for indicator, pattern in _COMPANY_INDICATOR_PATTERNS:
         if indicator in first_paragraph:
             # Try to extract company name + indicator
-            pattern = r'([A-Za-z0-9\s\-\&\.]+' + re.escape(indicator) + r')'
-            match = re.search(pattern, first_paragraph)
+            match = pattern.search(first_paragraph)
             if match:
                 return match.group(1).strip()
     
     return ""
 
+# Remote and hybrid indicators, each set combined into one alternation so the
+# text is scanned once per set
+_REMOTE_PATTERN = re.compile('|'.join([
+    r'\b(?:fully[\s-]+remote|100%[\s-]+remote)\b',
+    r'\b(?:remote(?:\s+position|\s+job|\s+work|\s+opportunity)?)\b',
+    r'\b(?:work[\s-]+from[\s-]+home|wfh)\b'
+]), re.IGNORECASE)
+
+_HYBRID_PATTERN = re.compile('|'.join([
+    r'\b(?:hybrid(?:\s+position|\s+job|\s+work|\s+opportunity)?)\b',
+    r'\b(?:remote\/on[\s-]*site|on[\s-]*site\/remote)\b',
+    r'\b(?:partially[\s-]+remote|work[\s-]+from[\s-]+home[\s-]+part[\s-]+time)\b'
+]), re.IGNORECASE)
+
+# Common patterns for job locations (anchored to run starts like _TITLE_PATTERNS)
+_LOCATION_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:location|place|based\s+in|located\s+in|position\s+is\s+in)[\s:]+([A-Za-z0-9\s\-\,\.]+)(?:\n|\.|,)',
+    r'(?:in|at)\s+([A-Za-z]+(?:\s*,\s*[A-Za-z]+)?)',
+    r'(?<![A-Za-z])([A-Za-z]+(?:\s*,\s*[A-Za-z]+)?)(?:\s+office)'
+)]
+
 def extract_location(text):
     """
     Extract job location from text.
@@ -95,45 +185,47 @@ def extract_location(text):
         str: Job location (or "Remote" if remote position)
     """
     # Check for remote indicators first - they're the most reliable
-    remote_patterns = [
-        r'\b(?:fully[\s-]+remote|100%[\s-]+remote)\b',
-        r'\b(?:remote(?:\s+position|\s+job|\s+work|\s+opportunity)?)\b',
-        r'\b(?:work[\s-]+from[\s-]+home|wfh)\b'
-    ]
-    
-    for pattern in remote_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return "Remote"
+    if _REMOTE_PATTERN.search(text):
+        return "Remote"
     
     # Check for hybrid indicators
-    hybrid_patterns = [
-        r'\b(?:hybrid(?:\s+position|\s+job|\s+work|\s+opportunity)?)\b',
-        r'\b(?:remote\/on[\s-]*site|on[\s-]*site\/remote)\b',
-        r'\b(?:partially[\s-]+remote|work[\s-]+from[\s-]+home[\s-]+part[\s-]+time)\b'
-    ]
-    
-    for pattern in hybrid_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            return "Hybrid"
+    if _HYBRID_PATTERN.search(text):
+        return "Hybrid"
     
-    # Common patterns for job locations
-    location_patterns = [
-        r'(?:location|place|based\s+in|located\s+in|position\s+is\s+in)[\s:]+([A-Za-z0-9\s\-\,\.]+)(?:\n|\.|,)',
-        r'(?:in|at)\s+([A-Za-z]+(?:\s*,\s*[A-Za-z]+)?)',
-        r'([A-Za-z]+(?:\s*,\s*[A-Za-z]+)?)(?:\s+office)'
-    ]
-    
-    for pattern in location_patterns:
-        matches = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _LOCATION_PATTERNS:
+        matches = pattern.search(text)
         if matches:
             location = matches.group(1).strip()
             # Clean up location
-            location = re.sub(r'\b(the|a|an|is|are|we|our|this|that)\b', '', location, flags=re.IGNORECASE).strip()
+            location = _FILLER_WORDS_PATTERN.sub('', location).strip()
             if 2 < len(location) < 50:  # Reasonable location length
                 return location
     
     return ""
 
+# Common job types, one word-bounded alternation per type to avoid partial matches
+_JOB_TYPE_KEYWORDS = {
+    "full-time": ["full time", "full-time", "permanent", "ft", "regular", "permanent role"],
+    "part-time": ["part time", "part-time", "pt"],
+    "contract": ["contract", "temporary", "temp", "fixed term", "fixed-term"],
+    "internship": ["intern", "internship", "trainee", "training"],
+    "freelance": ["freelance", "freelancer", "self-employed"]
+}
+
+_JOB_TYPES = list(_JOB_TYPE_KEYWORDS)
+
+_JOB_TYPE_PATTERNS = [
+    re.compile(r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b')
+    for keywords in _JOB_TYPE_KEYWORDS.values()
+]
+
+# All job types in one alternation with a capture group per type (group i + 1 is type i),
+# so a single scan finds the earliest keyword of any type
+_JOB_TYPE_SCAN_PATTERN = re.compile(r'\b(?:' + '|'.join(
+    '(' + '|'.join(re.escape(keyword) for keyword in keywords) + ')'
+    for keywords in _JOB_TYPE_KEYWORDS.values()
+) + r')\b')
+
 def extract_job_type(text):
     """
     Extract job type from text.
@@ -144,28 +236,43 @@ def extract_job_type(text):
     Returns:
         str: Job type (e.g., full-time, part-time, contract)
     """
-    # Common job types
-    job_types = {
-        "full-time": ["full time", "full-time", "permanent", "ft", "regular", "permanent role"],
-        "part-time": ["part time", "part-time", "pt"],
-        "contract": ["contract", "temporary", "temp", "fixed term", "fixed-term"],
-        "internship": ["intern", "internship", "trainee", "training"],
-        "freelance": ["freelance", "freelancer", "self-employed"]
-    }
-    
-    text_lower = text.lower()
-    
-    # Check for each job type in the text
-    for job_type, keywords in job_types.items():
-        for keyword in keywords:
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, text_lower):
-                return job_type
+    index, _ = _search_in_priority_order(_JOB_TYPE_SCAN_PATTERN, _JOB_TYPE_PATTERNS, text.lower())
+    if index != -1:
+        return _JOB_TYPES[index]
     
     # Default to full-time if no match found
     return "full-time"
 
+# Salary range patterns in priority order; the first one matching anywhere in the text wins.
+# Each captures the range as min and max, and the currency symbol where it has one
+# (those opening with the minimum are anchored to run starts like _TITLE_PATTERNS)
+_SALARY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Currency symbol + numbers with optional K/L + range separator + numbers with optional K/L
+    r'(?P<symbol>[$₹€£¥])(?P<min>\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?\s*(?:-|to|–)\s*(?:(?P=symbol))?(?P<max>\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?',
+    
+    # Numbers with optional K/L + range separator + numbers with optional K/L + currency symbol
+    r'(?<!\d)(?P<min>\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?\s*(?:-|to|–)\s*(?P<max>\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?\s*(?P<symbol>[₹$€£¥])',
+    
+    # Salary keywords + optional currency symbol + numbers with optional K/L + range separator + numbers with optional K/L
+    r'(?:salary|compensation|pay|ctc|package)(?:\s+range)?[\s:]*(?P<symbol>[₹$€£¥])?(?P<min>\d+(?:[,.]\d+)?)(?:\s*k|\s*K|L|lakh|lakhs)?\s*(?:-|to|–)\s*(?:[₹$€£¥])?(?P<max>\d+(?:[,.]\d+)?)(?:\s*k|\s*K|L|lakh|lakhs)?',
+    
+    # Numbers + range separator + numbers + per annum/year/month
+    r'(?<!\d)(?P<min>\d+)(?:[,.]\d+)?\s*(?:-|to|–)\s*(?P<max>\d+)(?:[,.]\d+)?\s*(?:per\s+(?:year|annum|pa|month|annum))'
+)]
+
+# Numeric range that every salary pattern contains (number, optional K/L unit,
+# separator, optional symbol, number), so postings without one skip them all
+_SALARY_RANGE_PATTERN = re.compile(r'\d\s*(?:k|l|lakh|lakhs)?\s*(?:-|to|–)\s*[$₹€£¥]?\d', re.IGNORECASE)
+
+# Currency symbols to currency codes, in the order nearby symbols are checked
+_CURRENCY_CODES = {
+    "$": "USD", 
+    "₹": "INR", 
+    "€": "EUR", 
+    "£": "GBP", 
+    "¥": "JPY"
+}
+
 def extract_salary(text):
     """
     Extract salary information from text.
@@ -182,74 +289,29 @@ def extract_salary(text):
         "currency": "INR"  # Default currency
     }
     
-    # Common patterns for salary ranges
-    patterns = [
-        # Currency symbol + numbers with optional K/L + range separator + numbers with optional K/L
-        r'([$₹€£¥])(\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?\s*(?:-|to|–)\s*(?:\1)?(\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?',
-        
-        # Numbers with optional K/L + range separator + numbers with optional K/L + currency symbol
-        r'(\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?\s*(?:-|to|–)\s*(\d+(?:[,.]\d+)?)\s*(?:k|K|L|lakh|lakhs)?\s*([₹$€£¥])',
-        
-        # Salary keywords + optional currency symbol + numbers with optional K/L + range separator + numbers with optional K/L
-        r'(?:salary|compensation|pay|ctc|package)(?:\s+range)?[\s:]*([₹$€£¥])?(\d+(?:[,.]\d+)?)(?:\s*k|\s*K|L|lakh|lakhs)?\s*(?:-|to|–)\s*(?:[₹$€£¥])?(\d+(?:[,.]\d+)?)(?:\s*k|\s*K|L|lakh|lakhs)?',
-        
-        # Numbers + range separator + numbers + per annum/year/month
-        r'(\d+)(?:[,.]\d+)?\s*(?:-|to|–)\s*(\d+)(?:[,.]\d+)?\s*(?:per\s+(?:year|annum|pa|month|annum))'
-    ]
+    if not _SALARY_RANGE_PATTERN.search(text):
+        return salary
     
-    # Currency symbols to currency codes
-    currency_map = {
-        "$": "USD", 
-        "₹": "INR", 
-        "€": "EUR", 
-        "£": "GBP", 
-        "¥": "JPY"
-    }
-    
-    for pattern in patterns:
-        matches = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _SALARY_PATTERNS:
+        matches = pattern.search(text)
         if matches:
-            # Different handling based on which pattern matched
-            if pattern == patterns[0]:  # First pattern with currency symbol
-                currency_symbol = matches.group(1)
-                min_salary = matches.group(2).replace(",", "")
-                max_salary = matches.group(3).replace(",", "")
-                
-                # Update currency
-                if currency_symbol in currency_map:
-                    salary["currency"] = currency_map[currency_symbol]
-                
-            elif pattern == patterns[1]:  # Numbers followed by currency
-                min_salary = matches.group(1).replace(",", "")
-                max_salary = matches.group(2).replace(",", "")
-                currency_symbol = matches.group(3)
-                
-                # Update currency
-                if currency_symbol in currency_map:
-                    salary["currency"] = currency_map[currency_symbol]
-                        
-            elif pattern == patterns[2]:  # Salary keywords pattern
-                currency_symbol = matches.group(1) if matches.group(1) else ""
-                min_salary = matches.group(2).replace(",", "")
-                max_salary = matches.group(3).replace(",", "")
-                
-                # Update currency
-                if currency_symbol in currency_map:
-                    salary["currency"] = currency_map[currency_symbol]
+            min_salary = matches.group('min').replace(",", "")
+            max_salary = matches.group('max').replace(",", "")
+            currency_symbol = matches.groupdict().get('symbol') or ""
             
-            else:  # Numbers with per annum/year/month
-                min_salary = matches.group(1).replace(",", "")
-                max_salary = matches.group(2).replace(",", "")
+            # Update currency
+            if currency_symbol in _CURRENCY_CODES:
+                salary["currency"] = _CURRENCY_CODES[currency_symbol]
             
             # Convert to numbers
             try:
                 match_text = text[matches.start():matches.end()].lower()
                 
-                # Check for multipliers
+                # Check for multipliers; match_text is lowercase, and 'lakh' contains 'l'
                 multiplier = 1
-                if any(x in match_text for x in ['k', 'K']):
+                if 'k' in match_text:
                     multiplier = 1000
-                elif any(x in match_text for x in ['l', 'L', 'lakh', 'lakhs']):
+                elif 'l' in match_text:
                     multiplier = 100000  # 1 lakh = 100,000
                 
                 salary["min"] = int(float(min_salary) * multiplier)
@@ -257,8 +319,9 @@ def extract_salary(text):
                 
                 # Check for potential currency mentions if not already set
                 if currency_symbol == "":
-                    for symbol, code in currency_map.items():
-                        if symbol in text[max(0, matches.start()-10):matches.end()+10]:
+                    nearby_text = text[max(0, matches.start()-10):matches.end()+10]
+                    for symbol, code in _CURRENCY_CODES.items():
+                        if symbol in nearby_text:
                             salary["currency"] = code
                             break
                 
@@ -273,6 +336,45 @@ def extract_salary(text):
     
     return salary
 
+# Common description section headers, in priority order
+_DESCRIPTION_HEADERS = [
+    "job description", "about the role", "about the job",
+    "position overview", "position description", "role details",
+    "what you'll do", "responsibilities", "duties", 
+    "about the position", "the role"
+]
+
+_DESCRIPTION_HEADER_PATTERNS = [
+    re.compile(r'\b' + re.escape(header) + r'(?:s)?[\s:]*\n?', re.IGNORECASE)
+    for header in _DESCRIPTION_HEADERS
+]
+
+# All headers in one alternation with a capture group per header
+_DESCRIPTION_HEADER_SCAN_PATTERN = re.compile(
+    r'\b(?:' + '|'.join('(' + re.escape(header) + ')' for header in _DESCRIPTION_HEADERS) + r')',
+    re.IGNORECASE
+)
+
+# Headers of the sections that usually follow the description; the earliest one
+# ends it, so they share one alternation. Only where the match starts is used,
+# so nothing after the marker is matched
+_DESCRIPTION_END_MARKERS = [
+    "requirements", "qualifications", "skills required", 
+    "what you'll need", "about the company", "benefits", 
+    "about us", "who you are", "how to apply", "education",
+    "experience required", "key skills", "desired skills",
+    "application process", "apply now"
+]
+
+_DESCRIPTION_END_PATTERN = re.compile(
+    r'\n\s*(?:' + '|'.join(re.escape(marker) for marker in _DESCRIPTION_END_MARKERS) + r')',
+    re.IGNORECASE
+)
+
+# Blank-line runs and leftover runs of three or more newlines
+_BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+_EXTRA_NEWLINES_PATTERN = re.compile(r'\n{3,}')
+
 def extract_description(text):
     """
     Extract job description from text.
@@ -286,49 +388,25 @@ def extract_description(text):
     # Initialize with the full text as fallback
     description = text
     
-    # Look for common description section headers
-    description_headers = [
-        "job description", "about the role", "about the job",
-        "position overview", "position description", "role details",
-        "what you'll do", "responsibilities", "duties", 
-        "about the position", "the role"
-    ]
-    
     # Try to find the start of the description section
-    start_idx = -1
-    for header in description_headers:
-        pattern = r'\b' + re.escape(header) + r'(?:s)?[\s:]*\n?'
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            start_idx = match.start()
-            break
+    _, match = _search_in_priority_order(_DESCRIPTION_HEADER_SCAN_PATTERN, _DESCRIPTION_HEADER_PATTERNS, text)
     
     # If we found a description header, extract everything after it
-    if start_idx != -1:
-        description = text[start_idx:].strip()
-        
-        # Try to find where the description ends (next major section)
-        end_markers = [
-            "requirements", "qualifications", "skills required", 
-            "what you'll need", "about the company", "benefits", 
-            "about us", "who you are", "how to apply", "education",
-            "experience required", "key skills", "desired skills",
-            "application process", "apply now"
-        ]
+    if match:
+        start_idx = match.start()
         
-        end_idx = len(description)
-        for marker in end_markers:
-            pattern = r'\n\s*' + re.escape(marker) + r'(?:s)?[\s:]*\n?'
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match and match.start() < end_idx:
-                end_idx = match.start()
+        # Find where the description ends (next major section), continuing
+        # from the header instead of copying the rest of the text
+        end_idx = len(text)
+        match = _DESCRIPTION_END_PATTERN.search(text, start_idx)
+        if match:
+            end_idx = match.start()
         
         # Extract just the description section
-        if end_idx < len(description):
-            description = description[:end_idx].strip()
+        description = text[start_idx:end_idx].strip()
     
     # Clean up excessive whitespace and line breaks
-    description = re.sub(r'\n\s*\n', '\n\n', description)
-    description = re.sub(r'\n{3,}', '\n\n', description)
+    description = _BLANK_LINES_PATTERN.sub('\n\n', description)
+    description = _EXTRA_NEWLINES_PATTERN.sub('\n\n', description)
     
     return description
\ No newline at end of file